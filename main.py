@@ -7,89 +7,378 @@ architecture in `src/` (orchestrator, navigation, persistence, owner
 enrichment, etc.).
 """
 
+import asyncio
+import csv
 import json
 import os
 from pathlib import Path
-from playwright.sync_api import sync_playwright
-from dataclasses import dataclass, asdict, field
-import pandas as pd
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from dataclasses import dataclass, field
+from typing import Union
 import argparse
+import numpy as np
 import time
 import logging
 import datetime
 import re
+import threading
 
-from src.utils import load_dotenv
-
-l1=[]
-l2=[]
-
-Name = ""
-Address = ""
-Website = ""
-Phone_Number = ""
-Reviews_Count = 0
-Reviews_Average = 0
-Store_Shopping = ""
-In_Store_Pickup = ""
-Store_Delivery = ""
-Place_Type = ""
-Opens_At = ""
-Introduction = ""
-
-names_list=[]
-address_list=[]
-website_list=[]
-phones_list=[]
-reviews_c_list=[]
-reviews_a_list=[]
-store_s_list=[]
-in_store_list=[]
-store_del_list=[]
-place_t_list=[]
-open_list=[]
-intro_list=[]
+from src.utils import load_dotenv, resolve_chrome_binary
+
+@dataclass(frozen=True)
+class Row:
+    """One scraped listing as written to result.csv"""
+    place_id: str = ""
+    name: str = ""
+    website: str = ""
+    introduction: str = ""
+    phone: str = ""
+    address: str = ""
+    maps_url: str = ""
+    reviews_count: Union[int, str] = ""
+    reviews_avg: Union[float, str] = ""
+    store_shopping: str = "No"
+    in_store_pickup: str = "No"
+    delivery: str = "No"
+    place_type: str = ""
+    opens_at: str = ""
+
+    def to_record(self):
+        """Map the row onto the CSV column names"""
+        # Field values are plain scalars, so skip astuple's recursive deep copy
+        return dict(zip(RESULT_FIELDS, vars(self).values()))
+
+
+# CSV columns, in the same order as the Row fields
+RESULT_FIELDS = [
+    'Place ID', 'Names', 'Website', 'Introduction', 'Phone Number', 'Address',
+    'Maps URL', 'Review Count', 'Average Review', 'Store Shopping',
+    'In Store Pickup', 'Delivery', 'Type', 'Opens At',
+]
+REVIEW_CSV_FIELDS = [
+    'place_id', 'business_name', 'business_address', 'reviewer_name',
+    'review_text', 'rating', 'review_date', 'owner_response', 'language',
+]
+
+# Translation tables and patterns used when parsing listing text
+PAREN_COMMA_TABLE = str.maketrans('', '', '(),')
+DECIMAL_COMMA_TABLE = str.maketrans(',', '.')
+NARROW_NBSP_TABLE = str.maketrans('', '', '\u202f')
+NEWLINE_TABLE = str.maketrans('', '', '\n')
+RATING_RE = re.compile(r'(\d+[.,]\d+|\d+)')
+PLACE_ID_RE = re.compile(r'!19s([^!]*)')
+PLACE_SEGMENT_RE = re.compile(r'(?:^|/)([^/]*:0x[^/]*)')
+# Text between the first and second '·' of a service info line
+INFO_RE = re.compile(r'·([^·]*)')
+OPENS_SEP = '⋅'
+
+# Common words used to guess the language of a review
+WORD_RE = re.compile(r'\w+')
+GERMAN_WORDS = frozenset({'und', 'der', 'die', 'das', 'ist', 'sehr', 'gut', 'für', 'mit', 'von', 'nicht'})
+ENGLISH_WORDS = frozenset({'and', 'the', 'is', 'very', 'good', 'for', 'with', 'not', 'this', 'that'})
+
+# Selector fallbacks for the reviews tab, review feed and review fields
+REVIEWS_TAB_SELECTORS = [
+    'button[role="tab"][aria-label*="Rezensionen"]',
+    'button[role="tab"][aria-label*="Reviews"]',
+    'xpath=//button[@role="tab"]//div[contains(text(), "Rezensionen")]/..',
+    'xpath=//button[@role="tab"]//div[contains(text(), "Reviews")]/..',
+    'button[role="tab"][data-tab-index="1"]',  # Often the reviews tab is the second tab
+    'button[jsaction="pane.rating.moreReviews"]'   # Original selector as fallback
+]
+REVIEW_FEED_SELECTORS = [
+    'xpath=//*[@id="QA0Szd"]/div/div/div[1]/div[3]/div/div[1]/div/div/div[3]',  # Exact XPath
+    '#QA0Szd > div > div > div.w6VYqd > div.bJzME.Hu9e2e.tTVLSc > div > div.e07Vkf.kA9KIf > div > div > div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde',  # CSS path
+    'div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde',  # Simple class selector
+    'div[role="feed"]',  # Generic role selector (fallback)
+    '.m6QErb'  # Simple class (fallback)
+]
+REVIEWER_NAME_SELECTORS = [
+    'css=div.d4r55',
+    '.d4r55'  # CSS shorthand
+]
+REVIEW_TEXT_SELECTORS = [
+    'css=div.MyEned span.wiI7pd',
+    '.wiI7pd'  # CSS shorthand
+]
+REVIEW_STARS_SELECTORS = [
+    'css=span.kvMYJc',
+    '.kvMYJc'  # CSS shorthand
+]
+REVIEW_DATE_SELECTORS = [
+    'css=span.rsqaWe',
+    '.rsqaWe'  # CSS shorthand
+]
+OWNER_RESPONSE_SELECTORS = [
+    'css=div.CDe7pd div.wiI7pd',
+    'div.CDe7pd .wiI7pd'  # CSS shorthand
+]
+
+# Service keyword -> position in the (shopping, pickup, delivery) flags
+SERVICE_KEYWORDS = {'shop': 0, 'pickup': 1, 'delivery': 2}
 
 # Ensure environment variables (e.g. OPENROUTER_API_KEY) are loaded for legacy flows.
 load_dotenv(Path(__file__).resolve().parent / ".env", override=False)
 
-def extract_data(xpath, data_list, page):
-    if page.locator(xpath).count() > 0:
-        data = page.locator(xpath).inner_text()
-    else:
-        data = ""
-    data_list.append(data)
+# CSS selectors for the search results and listing detail pane
+PLACE_LINK_SELECTOR = 'a[href*="/maps/place"]'
+SEARCH_BOX_SELECTOR = 'input#searchboxinput'
+RESULTS_FEED_SELECTOR = '[role="feed"]'
+NAME_SELECTOR = 'div.TIHn2 h1.DUwDvf.lfPIob'
+REVIEW_CONTAINER_SELECTOR = 'div.jftiEf.fontBodyMedium'
+
+# True once more elements match a selector than before the last scroll
+MORE_MATCHES_JS = "([sel, prev]) => document.querySelectorAll(sel).length > prev"
+
+# Scrolls the first fallback container that exists to its bottom and returns
+# the selector it used, or null when none of them is on the page
+SCROLL_FIRST_JS = """(selectors) => {
+    for (const sel of selectors) {
+        let element;
+        if (sel.startsWith('xpath=')) {
+            element = document.evaluate(sel.slice(6), document, null,
+                                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } else {
+            try {
+                element = document.querySelector(sel);
+            } catch (e) {
+                element = null;
+            }
+        }
+        if (element) {
+            element.scrollTop = element.scrollHeight;
+            return sel;
+        }
+    }
+    return null;
+}"""
+
+DETAIL_TEXT_SELECTORS = {
+    'name': NAME_SELECTOR,
+    'address': 'button[data-item-id="address"] div.fontBodyMedium',
+    'website': 'a[data-item-id="authority"] div.fontBodyMedium',
+    'phone': 'button[data-item-id^="phone:tel:"] div.fontBodyMedium',
+    'reviewsCount': 'div.TIHn2 div.fontBodyMedium.dmRWX div span span span[aria-label]',
+    'placeType': 'div.LBgpqf button.DkEaL',
+    'intro': 'div.WeS02d.fontBodyMedium div.PYvSYb',
+    'opens': 'button[data-item-id*="oh"] div.fontBodyMedium',
+}
+DETAIL_ATTR_SELECTORS = {
+    'reviewsAvg': ['span[role="img"].ceNzKf[aria-label*="Sterne"]', 'aria-label'],
+}
+DETAIL_LIST_SELECTORS = {
+    'info': 'div.LTs0Rc',
+}
+
+# Scrolls the results feed until `target` cards are present or no new cards
+# arrive for `maxStalls` rounds, entirely inside the page. Each round waits at
+# most `stallTimeout` ms and returns early once the card count grows.
+SCROLL_FEED_JS = """async ({feed, link, target, maxStalls, stallTimeout, budget}) => {
+    const count = () => document.querySelectorAll(link).length;
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const deadline = Date.now() + budget;
+    let prev = 0;
+    let stalls = 0;
+    while (stalls < maxStalls && Date.now() < deadline) {
+        const n = count();
+        if (n >= target) return n;
+        // Break early if we've scrolled enough
+        if (n > 40 && stalls >= 2) return n;
+        if (n === prev) {
+            stalls++;
+        } else {
+            stalls = 0;
+            prev = n;
+        }
+        const el = document.querySelector(feed);
+        if (el) {
+            el.scrollTop = el.scrollHeight;
+        } else {
+            window.scrollBy(0, 20000);
+        }
+        const wait = Math.min(stallTimeout, deadline - Date.now());
+        for (let waited = 0; waited < wait && count() <= n; waited += 100) {
+            await sleep(100);
+        }
+    }
+    return count();
+}"""
 
-def generate_grid(bounds, grid_size=2):
+# Chromium flags that switch off background work and UI the scraper never uses
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI,BackForwardCache,CalculateNativeWinOcclusion",
+    "--mute-audio",
+    "--hide-scrollbars",
+]
+# Timeouts: navigation and action defaults (ms) for every pooled context,
+# plus wall-clock budgets (s) for one grid cell search and one detail page
+NAVIGATION_TIMEOUT = 20000
+ACTION_TIMEOUT = 5000
+CELL_TIMEOUT = 45
+DETAIL_TIMEOUT = 15
+
+# Attempts per detail page before it is logged to the errors file
+MAX_DETAIL_ATTEMPTS = 3
+
+# Place IDs that were claimed for detail scraping, one per line, kept out of
+# the progress JSON so claiming a listing is an append instead of a rewrite
+SEEN_IDS_FILE = 'seen_ids.txt'
+
+# Listing URLs collected by finished grid cells and not scraped yet, one per
+# line, so collecting a cell appends to it instead of growing the progress JSON
+PENDING_URLS_FILE = 'pending_urls.txt'
+
+# Cookies saved by the package scraper after it clears the consent banner;
+# new contexts start from them so Maps skips the consent redirect
+STORAGE_STATE_FILE = 'gmaps_state.json'
+
+# The progress file is rewritten at most this often (s) or after this many
+# changes, whichever comes first
+PROGRESS_SAVE_INTERVAL = 5
+PROGRESS_SAVE_EVERY = 25
+
+# Result rows are flushed to disk after this many writes, and whenever the
+# progress file is saved
+RESULT_FLUSH_EVERY = 64
+REVIEW_FLUSH_EVERY = 256
+TRANSIENT_ERRORS = (PlaywrightTimeoutError, PlaywrightError, asyncio.TimeoutError)
+
+# A smaller viewport renders fewer result cards per scroll tick
+VIEWPORT = {"width": 1280, "height": 900}
+
+# Requests the scraper never reads; aborting them keeps page loads light.
+# Stylesheets are kept because the results feed needs its layout to scroll.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "texttrack", "manifest"})
+BLOCKED_URL_PATTERNS = (
+    "googleadservices",
+    "google-analytics",
+    "doubleclick",
+    "gen_204",
+    "log204",
+    "gstatic.com/mapfiles",
+    "khms",
+    "maps/vt",
+)
+# All URL patterns in one alternation, so each request is a single scan
+BLOCKED_URL_RE = re.compile("|".join(map(re.escape, BLOCKED_URL_PATTERNS)))
+
+# Resolves a batch of selectors in the page and returns their text (or an
+# attribute value) keyed by field name, so a listing costs one round-trip.
+DETAIL_FIELDS_JS = """(fields) => {
+    const out = {};
+    for (const [key, sel] of Object.entries(fields.text)) {
+        const node = document.querySelector(sel);
+        out[key] = node ? node.innerText : "";
+    }
+    for (const [key, [sel, attr]] of Object.entries(fields.attr)) {
+        const node = document.querySelector(sel);
+        out[key] = node ? (node.getAttribute(attr) || "") : "";
+    }
+    for (const [key, sel] of Object.entries(fields.all)) {
+        out[key] = Array.from(document.querySelectorAll(sel), (node) => node.innerText);
+    }
+    return out;
+}"""
+DETAIL_FIELDS = {
+    'text': DETAIL_TEXT_SELECTORS,
+    'attr': DETAIL_ATTR_SELECTORS,
+    'all': DETAIL_LIST_SELECTORS,
+}
+
+# Reads the fields of up to `limit` review containers in one call. Each field
+# takes the first of its fallback selectors that matches inside the container.
+REVIEW_FIELDS_JS = """(els, [fields, limit]) => els.slice(0, limit).map((el) => {
+    const find = (sel) => {
+        try {
+            return el.querySelector(sel.replace(/^css=/, ''));
+        } catch (e) {
+            return null;
+        }
+    };
+    const out = {};
+    for (const [key, selectors] of Object.entries(fields.text)) {
+        out[key] = "";
+        for (const sel of selectors) {
+            const node = find(sel);
+            if (node) {
+                out[key] = node.innerText;
+                break;
+            }
+        }
+    }
+    for (const [key, [selectors, attr]] of Object.entries(fields.attr)) {
+        out[key] = null;
+        for (const sel of selectors) {
+            const node = find(sel);
+            const value = node ? node.getAttribute(attr) : null;
+            if (value !== null) {
+                out[key] = value;
+                break;
+            }
+        }
+    }
+    return out;
+})"""
+REVIEW_FIELDS = {
+    'text': {
+        'reviewer_name': REVIEWER_NAME_SELECTORS,
+        'review_text': REVIEW_TEXT_SELECTORS,
+        'review_date': REVIEW_DATE_SELECTORS,
+        'owner_response': OWNER_RESPONSE_SELECTORS,
+    },
+    'attr': {
+        'stars': [REVIEW_STARS_SELECTORS, 'aria-label'],
+    },
+}
+
+def generate_grid(bounds, grid_size=2, zoom=12):
     """
     Generate a grid of coordinates within the specified bounds.
     
     Args:
         bounds: tuple of (min_lat, min_lng, max_lat, max_lng)
         grid_size: number of cells in each dimension (grid_size x grid_size total cells)
+        zoom: Google Maps zoom level used for every cell
     
     Returns:
         List of (center_lat, center_lng, zoom) tuples for each grid cell
     """
     min_lat, min_lng, max_lat, max_lng = bounds
-    lat_step = (max_lat - min_lat) / grid_size
-    lng_step = (max_lng - min_lng) / grid_size
-    
-    grid_points = []
-    
-    for i in range(grid_size):
-        for j in range(grid_size):
-            center_lat = min_lat + (i + 0.5) * lat_step
-            center_lng = min_lng + (j + 0.5) * lng_step
-            # Use zoom level 16 as it's the sweet spot
-            grid_points.append((center_lat, center_lng, 12))
+    offsets = np.arange(grid_size) + 0.5
+    lats = min_lat + offsets * (max_lat - min_lat) / grid_size
+    lngs = min_lng + offsets * (max_lng - min_lng) / grid_size
     
-    return grid_points
+    # Row-major order (latitude outer, longitude inner) like the old nested loop
+    lat_grid, lng_grid = np.meshgrid(lats, lngs, indexing='ij')
+    return [
+        (lat, lng, zoom)
+        for lat, lng in zip(lat_grid.ravel().tolist(), lng_grid.ravel().tolist())
+    ]
+
+def encode_progress(progress_data):
+    """Encode progress data as compact JSON"""
+    # json.dumps goes through the C encoder in one shot, json.dump streams
+    # through the pure-Python one
+    return json.dumps(progress_data, separators=(',', ':'))
+
+def write_progress_text(text, filename='scraper_progress.json'):
+    """Replace the progress file with already encoded JSON"""
+    # Write to a temp file first so a crash mid-write keeps the old progress
+    tmp_path = f"{filename}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, filename)
 
 def save_progress(progress_data, filename='scraper_progress.json'):
     """Save progress data to a JSON file for job continuation"""
-    with open(filename, 'w') as f:
-        json.dump(progress_data, f)
+    write_progress_text(encode_progress(progress_data), filename)
 
 def load_progress(filename='scraper_progress.json'):
     """Load progress data from a JSON file"""
@@ -98,7 +387,6 @@ def load_progress(filename='scraper_progress.json'):
             return json.load(f)
     return {
         "completed_cells": [],
-        "seen_urls": [],
         "results_count": 0,
         "search_term": "",
         "bounds": [],
@@ -106,112 +394,270 @@ def load_progress(filename='scraper_progress.json'):
         "total_target": 0
     }
 
-def append_to_csv(new_data, filename='result.csv'):
-    """Append new data to the CSV file with duplicate checking"""
-    # Check if file exists
+def load_seen_ids(filename=SEEN_IDS_FILE):
+    """Replay the seen place ID log; lines starting with '-' release an ID again"""
+    seen = set()
+    if os.path.exists(filename):
+        with open(filename, encoding='utf-8') as f:
+            for line in f:
+                place_id = line.rstrip('\n')
+                if place_id.startswith('-'):
+                    seen.discard(place_id[1:])
+                elif place_id:
+                    seen.add(place_id)
+    return seen
+
+def write_seen_ids(seen, filename=SEEN_IDS_FILE):
+    """Rewrite the seen place ID log compactly and return it opened for appending"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.writelines(f"{place_id}\n" for place_id in seen)
+    return open(filename, 'a', encoding='utf-8')
+
+def load_pending_urls(filename=PENDING_URLS_FILE):
+    """Read the listing URLs collected by earlier runs"""
     if not os.path.exists(filename):
-        # Create new file with header
-        df = pd.DataFrame([new_data], columns=new_data.keys())
-        df.to_csv(filename, index=False)
-        return True
-    else:
-        # Read existing data to check for duplicates
-        existing_df = pd.read_csv(filename)
-        
-        # Use name and address as a unique identifier
-        if len(existing_df) > 0:
-            # Check if this exact record already exists
-            duplicate = existing_df[(existing_df['Names'] == new_data['Names']) & 
-                                   (existing_df['Address'] == new_data['Address'])]
-            
-            if len(duplicate) > 0:
-                # Skip duplicate
-                print(f"Skipping duplicate: {new_data['Names']}")
-                return False
-        
-        # If not a duplicate, append to the file
-        df = pd.DataFrame([new_data])
-        df.to_csv(filename, mode='a', header=False, index=False)
+        return []
+    with open(filename, encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f if line.strip()]
+
+def write_pending_urls(urls, filename=PENDING_URLS_FILE):
+    """Rewrite the pending URL log and return it opened for appending"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.writelines(f"{url}\n" for url in urls)
+    return open(filename, 'a', encoding='utf-8')
+
+class ProgressWriter:
+    """Writes progress snapshots to disk on a background thread.
+
+    Snapshots are encoded when submitted, so later changes to the progress
+    dict cannot leak into a write in flight. Only the newest unwritten
+    snapshot is kept, so a burst of checkpoints costs a single write.
+    """
+
+    def __init__(self, filename='scraper_progress.json'):
+        self.filename = filename
+        self._cond = threading.Condition()
+        self._pending = None
+        self._submitted = 0
+        self._written = 0
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, progress_data, wait=False):
+        """Queue a snapshot; with wait=True block until it is on disk"""
+        text = encode_progress(progress_data)
+        with self._cond:
+            self._pending = text
+            self._submitted += 1
+            seq = self._submitted
+            self._cond.notify_all()
+            if wait:
+                self._cond.wait_for(lambda: self._written >= seq)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None)
+                text, seq = self._pending, self._submitted
+                self._pending = None
+            try:
+                write_progress_text(text, self.filename)
+            except OSError as e:
+                logging.getLogger().error(f"Failed to save progress: {e}")
+            with self._cond:
+                self._written = seq
+                self._cond.notify_all()
+
+class ResultWriter:
+    """Streams listing records to the result CSV as they are scraped.
+
+    Name/address pairs already in the file are loaded once on open so
+    duplicate checks are a set lookup instead of re-reading the CSV. Up to
+    two distinct non-empty values are kept per column so columns holding a
+    single value can be pruned at the end without another full scan. Rows
+    are buffered and flushed every RESULT_FLUSH_EVERY writes or on flush().
+    Columns pruned from an existing file are restored (blank for the rows
+    already in it) before appending, so resumed runs keep every field.
+    """
+
+    def __init__(self, filename='result.csv'):
+        self.filename = filename
+        self.seen = set()
+        self.count = 0
+        self.unflushed = 0
+        self.col_values = {column: set() for column in RESULT_FIELDS}
+        write_header = True
+
+        if os.path.exists(filename):
+            with open(filename, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                header = reader.fieldnames or []
+                for row in reader:
+                    self.seen.add((row.get('Names', ''), row.get('Address', '')))
+                    self._track_values(row)
+                    self.count += 1
+            write_header = not header
+            if header and header != RESULT_FIELDS:
+                self._restore_columns()
+
+        self._file = open(filename, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=RESULT_FIELDS)
+        if write_header:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, record):
+        """Append a record unless its name and address were already written"""
+        key = (str(record['Names']), str(record['Address']))
+        if key in self.seen:
+            print(f"Skipping duplicate: {record['Names']}")
+            return False
+
+        self._writer.writerow(record)
+        self.seen.add(key)
+        self._track_values(record)
+        self.count += 1
+        self.unflushed += 1
+        if self.unflushed >= RESULT_FLUSH_EVERY:
+            self.flush()
         return True
 
+    def flush(self):
+        if self.unflushed:
+            self._file.flush()
+            self.unflushed = 0
+
+    def _track_values(self, row):
+        for column, values in self.col_values.items():
+            value = row.get(column)
+            if len(values) < 2 and value not in (None, ''):
+                values.add(str(value))
+
+    def close(self):
+        self._file.close()
+        self.unflushed = 0
+
+    def _restore_columns(self):
+        """Rewrite the CSV with the full RESULT_FIELDS header, blank where pruned"""
+        tmp_path = f"{self.filename}.tmp"
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+                writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS, restval='',
+                                        extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(csv.DictReader(f))
+        os.replace(tmp_path, self.filename)
+
+    def prune_constant_columns(self):
+        """Rewrite the closed CSV without columns that hold a single value"""
+        drop = {column for column, values in self.col_values.items() if len(values) == 1}
+        if not drop:
+            return []
+
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            keep = [i for i, column in enumerate(header) if column not in drop]
+            tmp_path = f"{self.filename}.tmp"
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+                writer = csv.writer(out)
+                for row in [header, *reader]:
+                    writer.writerow([row[i] for i in keep if i < len(row)])
+        os.replace(tmp_path, self.filename)
+        return sorted(drop)
+
+def classify_service_info(infos):
+    """Map the service info lines of a listing to shopping/pickup/delivery flags"""
+    flags = ["No", "No", "No"]
+    for info in infos:
+        match = INFO_RE.search(info)
+        if match:  # Make sure the line has a separator
+            check = match.group(1).translate(NEWLINE_TABLE).lower()
+            for keyword, slot in SERVICE_KEYWORDS.items():
+                if keyword in check:
+                    flags[slot] = "Yes"
+                    break
+    return tuple(flags)
+
 def extract_place_id(url):
     """Extract the unique place ID from a Google Maps URL"""
-    try:
-        # Look for the !19s pattern which is followed by the place ID
-        if '!19s' in url:
-            # Extract everything after !19s
-            place_id = url.split('!19s')[1].split('!')[0]
-            return place_id
-        
-        # Alternative method - look for the data= pattern
-        elif 'data=' in url:
-            parts = url.split('/')
-            # Find the part with business ID
-            for part in parts:
-                if ':0x' in part:
-                    return part
-            
-        # If neither method works, use the full URL (less efficient)
-        return url
-    except:
+    if not url:
         return url
 
+    # Look for the !19s pattern which is followed by the place ID
+    match = PLACE_ID_RE.search(url)
+    if match:
+        return match.group(1)
+
+    # Alternative method - the path segment holding the 0x business ID
+    if 'data=' in url:
+        match = PLACE_SEGMENT_RE.search(url)
+        if match:
+            return match.group(1)
+
+    # If neither method works, use the full URL (less efficient)
+    return url
+
 def parse_star_rating(star_text):
     """Extract numeric rating from star text like '5 Sterne'"""
     if not star_text:
         return 0
     
-    # Extract the number from text like "5 Sterne" or "1 Stern"
-    match = re.search(r'(\d+)', star_text)
-    if match:
-        return int(match.group(1))
-    return 0
+    # Read the first run of digits in text like "5 Sterne" or "1 Stern"; a
+    # plain scan beats a regex search on these short labels
+    rating = 0
+    in_number = False
+    for ch in star_text:
+        if ch.isdecimal():
+            rating = rating * 10 + int(ch)
+            in_number = True
+        elif in_number:
+            break
+    return rating
 
-def extract_reviews(page, business_name, business_address, place_id, total_reviews_count=None, max_reviews=None):
+async def extract_reviews(page, business_name, business_address, place_id, total_reviews_count=None, max_reviews=None):
     """Extract reviews for the current business listing"""
     logger = logging.getLogger()
     reviews = []
     
     try:
         # First check if we need to click on reviews tab - using improved selectors based on the tab structure
-        # Try multiple selectors to improve robustness across different Google Maps versions and languages
-        reviews_tab_selectors = [
-            'xpath=//button[@role="tab" and contains(@aria-label, "Rezensionen")]',
-            'xpath=//button[@role="tab" and contains(@aria-label, "Reviews")]',
-            'xpath=//button[@role="tab"]//div[contains(text(), "Rezensionen")]/..',
-            'xpath=//button[@role="tab"]//div[contains(text(), "Reviews")]/..',
-            'xpath=//button[@role="tab" and @data-tab-index="1"]',  # Often the reviews tab is the second tab
-            'xpath=//button[@jsaction="pane.rating.moreReviews"]'   # Original selector as fallback
-        ]
         
         # Try each selector until we find a matching element
         reviews_tab_clicked = False
-        for selector in reviews_tab_selectors:
-            if page.locator(selector).count() > 0:
-                logger.info(f"Found reviews tab with selector: {selector}")
+        for selector in REVIEWS_TAB_SELECTORS:
+            # query_selector checks for the tab and hands it back in one round-trip
+            tab = await page.query_selector(selector)
+            if tab:
+                logger.debug("Found reviews tab with selector: %s", selector)
                 try:
-                    page.locator(selector).click()
-                    page.wait_for_timeout(2000)  # Wait for reviews to load
+                    await tab.click()
                     reviews_tab_clicked = True
                     break
                 except Exception as e:
                     logger.warning(f"Error clicking reviews tab with selector {selector}: {e}")
         
         if not reviews_tab_clicked:
-            logger.info("Could not find or click reviews tab, trying to continue with any available reviews")
+            logger.debug("Could not find or click reviews tab, trying to continue with any available reviews")
         
-        # Wait for review containers to appear
-        review_containers_selector = 'xpath=//div[@class="jftiEf fontBodyMedium "]'
-        try:
-            page.wait_for_selector(review_containers_selector, timeout=5000)
-        except:
-            logger.info("No reviews found for this location")
+        # Wait for review containers to appear. Without a tab click nothing
+        # more is going to load, so only look for ones already rendered
+        if reviews_tab_clicked:
+            try:
+                await page.wait_for_selector(REVIEW_CONTAINER_SELECTOR, timeout=5000)
+            except:
+                logger.debug("No reviews found for this location")
+                return reviews
+        elif not await page.query_selector(REVIEW_CONTAINER_SELECTOR):
+            logger.debug("No reviews found for this location")
             return reviews
         
-        # Get initial review count
-        review_containers = page.locator(review_containers_selector).all()
-        initial_review_count = len(review_containers)
-        logger.info(f"Found {initial_review_count} initial reviews")
+        # Get initial review count; the locator is built once and re-counted
+        # after each scroll, handles are only materialized for processing
+        review_locator = page.locator(REVIEW_CONTAINER_SELECTOR)
+        initial_review_count = await review_locator.count()
+        current_count = initial_review_count
+        logger.debug("Found %d initial reviews", initial_review_count)
         
         # Determine how many reviews to get - fix NoneType comparison
         if total_reviews_count and max_reviews:
@@ -223,232 +669,102 @@ def extract_reviews(page, business_name, business_address, place_id, total_revie
         else:
             target_reviews = 50  # Default value if no limits specified
         
-        logger.info(f"Target reviews to extract: {target_reviews}")
+        logger.debug("Target reviews to extract: %s", target_reviews)
         
         # Only scroll if we haven't loaded all reviews and there are actually more to load
         if initial_review_count < target_reviews:
             scroll_attempts = 0
             previous_count = initial_review_count
             
-            # Use the exact XPath for the scrollable container provided by the user
-            exact_feed_selectors = [
-                'xpath=//*[@id="QA0Szd"]/div/div/div[1]/div[3]/div/div[1]/div/div/div[3]',  # Exact XPath 
-                '#QA0Szd > div > div > div.w6VYqd > div.bJzME.Hu9e2e.tTVLSc > div > div.e07Vkf.kA9KIf > div > div > div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde',  # CSS path
-                'div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde',  # Simple class selector
-                'div[role="feed"]',  # Generic role selector (fallback)
-                '.m6QErb'  # Simple class (fallback)
-            ]
             
             # Scroll the feed container to load more reviews
-            while len(review_containers) < target_reviews and scroll_attempts < 10:  # Increased max attempts
+            while current_count < target_reviews and scroll_attempts < 10:  # Increased max attempts
                 scroll_success = False
                 
-                # Try multiple approaches to scrolling
-                for selector in exact_feed_selectors:
-                    try:
-                        # Check if selector exists first
-                        if page.locator(selector).count() > 0:
-                            # Fix JavaScript syntax errors in our evaluate calls
-                            if selector.startswith('xpath='):
-                                # For XPath selectors - fixed JS syntax
-                                page.evaluate("""
-                                    (xpath) => {
-                                        const result = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
-                                        const element = result.singleNodeValue;
-                                        if (element) {
-                                            element.scrollTop = element.scrollHeight;
-                                            return true;
-                                        }
-                                        return false;
-                                    }
-                                """, selector.replace('xpath=', ''))
-                                scroll_success = True
-                                logger.info(f"Successfully scrolled container with XPath: {selector}")
-                                break
-                            else:
-                                # For CSS selectors - fixed JS syntax
-                                page.evaluate("""
-                                    (selector) => {
-                                        const feed = document.querySelector(selector);
-                                        if (feed) {
-                                            feed.scrollTop = feed.scrollHeight;
-                                            return true;
-                                        }
-                                        return false;
-                                    }
-                                """, selector)
-                                scroll_success = True
-                                logger.info(f"Successfully scrolled container with CSS: {selector}")
-                                break
-                    except Exception as e:
-                        logger.warning(f"Error scrolling with selector {selector}: {e}")
+                # Try every feed selector in one call; the script reports which
+                # container it scrolled, so no separate existence check is needed
+                try:
+                    scrolled = await page.evaluate(SCROLL_FIRST_JS, REVIEW_FEED_SELECTORS)
+                    if scrolled:
+                        scroll_success = True
+                        logger.debug("Successfully scrolled container with selector: %s", scrolled)
+                except Exception as e:
+                    logger.warning(f"Error scrolling review feed: {e}")
                 
                 # If JavaScript scrolling failed, try using Playwright's mouse wheel
                 if not scroll_success:
                     try:
                         # Find a review element and scroll from there
-                        if page.locator(review_containers_selector).count() > 0:
+                        first_review = await page.query_selector(REVIEW_CONTAINER_SELECTOR)
+                        if first_review:
                             # First make sure an element is in view
-                            page.locator(review_containers_selector).first.scroll_into_view_if_needed()
+                            await first_review.scroll_into_view_if_needed()
                             # Then use mouse wheel
-                            page.mouse.wheel(0, 2000)
-                            logger.info("Used mouse wheel fallback scrolling")
+                            await page.mouse.wheel(0, 2000)
+                            logger.debug("Used mouse wheel fallback scrolling")
                             scroll_success = True
                     except Exception as e:
                         logger.warning(f"Fallback scrolling also failed: {e}")
                 
-                # Wait for more reviews to load
-                page.wait_for_timeout(2000)
+                # Wait for more reviews to load, returning as soon as they arrive
+                try:
+                    await page.wait_for_function(
+                        MORE_MATCHES_JS,
+                        arg=[REVIEW_CONTAINER_SELECTOR, previous_count],
+                        timeout=2000,
+                    )
+                except Exception:
+                    pass
                 
                 # Check if we got more reviews
-                review_containers = page.locator(review_containers_selector).all()
-                current_count = len(review_containers)
-                logger.info(f"After scroll: {current_count}/{target_reviews} reviews")
+                current_count = await review_locator.count()
+                logger.debug("After scroll: %d/%s reviews", current_count, target_reviews)
                 
                 # If we've loaded all available reviews, stop scrolling
                 if current_count == total_reviews_count and total_reviews_count > 0:
-                    logger.info(f"Loaded all {total_reviews_count} available reviews, stopping scroll")
+                    logger.debug("Loaded all %s available reviews, stopping scroll", total_reviews_count)
                     break
                 
                 if current_count <= previous_count:
                     scroll_attempts += 1
-                    logger.info(f"No new reviews loaded. Attempt {scroll_attempts}/10")
+                    logger.debug("No new reviews loaded. Attempt %d/10", scroll_attempts)
                     # If we've made multiple attempts with no new reviews, assume we've loaded all available
                     if scroll_attempts >= 5:  # Increased threshold
-                        logger.info("Reached maximum scroll attempts with no new results, assuming all reviews loaded")
+                        logger.debug("Reached maximum scroll attempts with no new results, assuming all reviews loaded")
                         break
                 else:
                     # Reset scroll attempts if we've loaded new reviews
                     scroll_attempts = 0
-                    logger.info(f"Loaded {current_count - previous_count} new reviews")
+                    logger.debug("Loaded %d new reviews", current_count - previous_count)
                 
                 previous_count = current_count
         else:
             if initial_review_count >= total_reviews_count and total_reviews_count > 0:
-                logger.info(f"Already loaded all {total_reviews_count} reviews, no need to scroll")
+                logger.debug("Already loaded all %s reviews, no need to scroll", total_reviews_count)
             elif initial_review_count >= target_reviews:
-                logger.info(f"Already loaded maximum number of reviews ({target_reviews}), no need to scroll")
+                logger.debug("Already loaded maximum number of reviews (%s), no need to scroll", target_reviews)
         
-        # Process all found reviews
-        review_count_to_process = min(len(review_containers), target_reviews) if target_reviews > 0 else len(review_containers)
-        logger.info(f"Processing {review_count_to_process} reviews")
+        # Read every field of every review in one evaluate; the fallback
+        # selectors are tried in the page instead of one round-trip each
+        review_fields = await review_locator.evaluate_all(REVIEW_FIELDS_JS, [REVIEW_FIELDS, target_reviews])
+        logger.debug("Processing %d reviews", len(review_fields))
         
-        # Process reviews in smaller batches to save continuously
-        batch_size = 10
-        for i in range(0, min(len(review_containers), target_reviews), batch_size):
-            batch_reviews = []
-            end_idx = min(i + batch_size, len(review_containers), target_reviews)
-            
-            for j in range(i, end_idx):
-                container = review_containers[j]
-                try:
-                    # Extract reviewer name - fixed selectors
-                    name_selectors = [
-                        'xpath=.//div[contains(@class, "d4r55")]',
-                        'css=div.d4r55',
-                        '.d4r55'  # CSS shorthand
-                    ]
-                    
-                    reviewer_name = ""
-                    for selector in name_selectors:
-                        try:
-                            if container.locator(selector).count() > 0:
-                                reviewer_name = container.locator(selector).inner_text()
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Extract review text - fixed selectors
-                    text_selectors = [
-                        'xpath=.//div[@class="MyEned"]//span[@class="wiI7pd"]',
-                        'css=div.MyEned span.wiI7pd',
-                        '.wiI7pd'  # CSS shorthand
-                    ]
-                    
-                    review_text = ""
-                    for selector in text_selectors:
-                        try:
-                            if container.locator(selector).count() > 0:
-                                review_text = container.locator(selector).inner_text()
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Extract star rating - fixed selectors
-                    stars_selectors = [
-                        'xpath=.//span[@class="kvMYJc"]',
-                        'css=span.kvMYJc',
-                        '.kvMYJc'  # CSS shorthand
-                    ]
-                    
-                    stars = 0
-                    for selector in stars_selectors:
-                        try:
-                            if container.locator(selector).count() > 0:
-                                stars_text = container.locator(selector).get_attribute('aria-label')
-                                stars = parse_star_rating(stars_text)
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Extract review date - fixed selectors
-                    date_selectors = [
-                        'xpath=.//span[@class="rsqaWe"]',
-                        'css=span.rsqaWe',
-                        '.rsqaWe'  # CSS shorthand
-                    ]
-                    
-                    date = ""
-                    for selector in date_selectors:
-                        try:
-                            if container.locator(selector).count() > 0:
-                                date = container.locator(selector).inner_text()
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Extract owner response - fixed selectors
-                    response_selectors = [
-                        'xpath=.//div[@class="CDe7pd"]//div[@class="wiI7pd"]',
-                        'css=div.CDe7pd div.wiI7pd',
-                        'div.CDe7pd .wiI7pd'  # CSS shorthand
-                    ]
-                    
-                    owner_response = ""
-                    for selector in response_selectors:
-                        try:
-                            if container.locator(selector).count() > 0:
-                                owner_response = container.locator(selector).inner_text()
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Create review object
-                    review = {
-                        'place_id': place_id,
-                        'business_name': business_name,
-                        'business_address': business_address,
-                        'reviewer_name': reviewer_name,
-                        'review_text': review_text,
-                        'rating': stars,
-                        'review_date': date,
-                        'owner_response': owner_response,
-                        'language': detect_language(review_text)
-                    }
-                    
-                    batch_reviews.append(review)
-                    reviews.append(review)
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting review {j+1}: {e}")
-                    continue
-            
-            # Save batch immediately
-            if batch_reviews:
-                save_reviews_to_csv(batch_reviews)
-                logger.info(f"Saved batch of {len(batch_reviews)} reviews")
+        for fields in review_fields:
+            stars_text = fields['stars']
+            review_text = fields['review_text']
+            reviews.append({
+                'place_id': place_id,
+                'business_name': business_name,
+                'business_address': business_address,
+                'reviewer_name': fields['reviewer_name'],
+                'review_text': review_text,
+                'rating': parse_star_rating(stars_text) if stars_text else 0,
+                'review_date': fields['review_date'],
+                'owner_response': fields['owner_response'],
+                'language': detect_language(review_text)
+            })
         
-        logger.info(f"Successfully extracted {len(reviews)} reviews")
+        logger.debug("Successfully extracted %d reviews", len(reviews))
         return reviews
         
     except Exception as e:
@@ -460,15 +776,10 @@ def detect_language(text):
     if not text:
         return "unknown"
         
-    # Simple language detection based on common words
-    german_words = ['und', 'der', 'die', 'das', 'ist', 'sehr', 'gut', 'für', 'mit', 'von', 'nicht']
-    english_words = ['and', 'the', 'is', 'very', 'good', 'for', 'with', 'not', 'this', 'that']
-    
-    text_lower = text.lower()
-    words = re.findall(r'\b\w+\b', text_lower)
-    
-    german_count = sum(1 for word in words if word in german_words)
-    english_count = sum(1 for word in words if word in english_words)
+    # Count common words of each language with set lookups
+    words = WORD_RE.findall(text.lower())
+    german_count = sum(word in GERMAN_WORDS for word in words)
+    english_count = sum(word in ENGLISH_WORDS for word in words)
     
     if german_count > english_count:
         return "de"
@@ -477,63 +788,531 @@ def detect_language(text):
     else:
         return "unknown"
 
-def save_reviews_to_csv(reviews, filename='reviews.csv'):
-    """Save reviews to a CSV file"""
-    if not reviews:
-        return
-    
-    # Check if file exists to determine if header is needed
-    file_exists = os.path.isfile(filename)
-    
-    # Create DataFrame from reviews
-    df = pd.DataFrame(reviews)
-    
-    # Write to CSV, append if file exists
-    df.to_csv(filename, mode='a', header=not file_exists, index=False, encoding='utf-8-sig')
-    
-    print(f"Saved {len(reviews)} reviews to {filename}")
+class ReviewWriter:
+    """Streams reviews to the reviews CSV through one open file.
+
+    Rows are buffered and flushed every REVIEW_FLUSH_EVERY reviews or on
+    flush(), instead of reopening the file for every listing.
+    """
+
+    def __init__(self, filename='reviews.csv'):
+        self.filename = filename
+        self.unflushed = 0
+
+        write_header = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        # Only a new file gets the BOM, appending must not repeat it mid-file
+        encoding = 'utf-8-sig' if write_header else 'utf-8'
+        self._file = open(filename, 'a', newline='', encoding=encoding)
+        self._writer = csv.DictWriter(self._file, fieldnames=REVIEW_CSV_FIELDS)
+        if write_header:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, reviews):
+        """Append the reviews of one listing"""
+        self._writer.writerows(reviews)
+        self.unflushed += len(reviews)
+        if self.unflushed >= REVIEW_FLUSH_EVERY:
+            self.flush()
+        logging.getLogger().debug("Saved %d reviews to %s", len(reviews), self.filename)
+
+    def flush(self):
+        if self.unflushed:
+            self._file.flush()
+            self.unflushed = 0
+
+    def close(self):
+        self._file.close()
+        self.unflushed = 0
 
 # Set up logging configuration
-def setup_logging():
+def setup_logging(level=logging.INFO):
     log_filename = f"scraper_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     logging.basicConfig(
-        level=logging.INFO,
+        level=level,
         format='%(asctime)s [%(levelname)s] %(message)s',
         handlers=[
-            logging.FileHandler(log_filename),
+            # The file is only created once something is logged
+            logging.FileHandler(log_filename, delay=True),
             logging.StreamHandler()
         ]
     )
     return logging.getLogger()
 
-def main():
+@dataclass
+class JobState:
+    """Shared state for grid cells that are scraped concurrently."""
+    search_for: str
+    total: int
+    progress: dict
+    completed_cells: list
+    seen_urls: set
+    results_count: int
+    writer: ResultWriter
+    review_writer: ReviewWriter
+    seen_file: object
+    pending_urls: list
+    pending_file: object
+    progress_writer: ProgressWriter
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    unsaved_changes: int = 0
+    last_save: float = field(default_factory=time.monotonic)
+
+    def mark_seen(self, place_id):
+        """Claim a place ID; the seen log is append-only so this is O(1) on disk"""
+        self.seen_urls.add(place_id)
+        self.seen_file.write(f"{place_id}\n")
+        self.checkpoint()
+
+    def unmark_seen(self, place_id):
+        """Release a claimed place ID so a resumed run tries it again"""
+        self.seen_urls.discard(place_id)
+        self.seen_file.write(f"-{place_id}\n")
+        self.checkpoint()
+
+    def checkpoint(self, force=False):
+        """Record a progress change and write the progress file when it is due.
+
+        Due saves go to the background writer; a forced save also waits
+        until the file is written.
+        """
+        self.unsaved_changes += 1
+        now = time.monotonic()
+        if (force or self.unsaved_changes >= PROGRESS_SAVE_EVERY
+                or now - self.last_save >= PROGRESS_SAVE_INTERVAL):
+            # Rows go to disk before the progress that counts them
+            self.writer.flush()
+            self.review_writer.flush()
+            self.seen_file.flush()
+            self.pending_file.flush()
+            self.progress_writer.submit(self.progress, wait=force)
+            self.unsaved_changes = 0
+            self.last_save = now
+
+
+async def block_unneeded_requests(route):
+    """Abort images, fonts, media, map tiles and telemetry requests"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class ContextPool:
+    """Fixed-size pool of browser contexts shared by the grid cell workers.
+
+    Contexts are reused across cells and replaced after `recycle_after`
+    cells so accumulated JS heap and service worker state is dropped.
+    """
+
+    def __init__(self, browser, size, recycle_after=10):
+        self.browser = browser
+        self.size = size
+        self.recycle_after = recycle_after
+        self._queue = asyncio.Queue()
+        self._uses = {}
+
+    async def start(self):
+        for _ in range(self.size):
+            await self._add_context()
+
+    async def _add_context(self):
+        storage_state = STORAGE_STATE_FILE if os.path.exists(STORAGE_STATE_FILE) else None
+        context = await self.browser.new_context(
+            viewport=VIEWPORT, service_workers="block", storage_state=storage_state
+        )
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+        context.set_default_timeout(ACTION_TIMEOUT)
+        await context.route("**/*", block_unneeded_requests)
+        self._uses[context] = 0
+        self._queue.put_nowait(context)
+
+    async def acquire(self):
+        return await self._queue.get()
+
+    async def release(self, context, uses=1):
+        self._uses[context] += uses
+        if self._uses[context] >= self.recycle_after:
+            del self._uses[context]
+            await context.close()
+            await self._add_context()
+        else:
+            self._queue.put_nowait(context)
+
+    async def close(self):
+        for context in list(self._uses):
+            await context.close()
+        self._uses.clear()
+
+
+async def mark_cell_collected(cell_id, hrefs, job):
+    """Persist a cell's listing URLs so a crashed run can resume the detail pass"""
+    async with job.lock:
+        job.pending_urls.extend(hrefs)
+        job.pending_file.writelines(f"{href}\n" for href in hrefs)
+        job.completed_cells.append(cell_id)
+        job.progress["completed_cells"] = job.completed_cells
+        # A collected cell is expensive to redo, so it is written right away
+        job.checkpoint(force=True)
+
+
+async def search_cell(page, cell_id, lat, lng, zoom, job, logger):
+    """Run the search for one grid cell and return the listing hrefs it shows"""
+    # Scrolling stops at the cell's budget so whatever loaded by then is kept
+    deadline = asyncio.get_running_loop().time() + CELL_TIMEOUT
+    # Go to Google Maps with specific coordinates and zoom level
+    logger.debug("Navigating to Google Maps at coordinates: %s, %s, zoom: %s", lat, lng, zoom)
+    await page.goto(f"https://www.google.com/maps/@{lat},{lng},{zoom}z", wait_until="domcontentloaded")
+    search_box = page.locator(SEARCH_BOX_SELECTOR)
+    await search_box.wait_for()
+
+    # Perform the search
+    logger.debug("Searching for: '%s'", job.search_for)
+    await search_box.fill(job.search_for)
+    await page.keyboard.press("Enter")
+
+    try:
+        logger.debug("Waiting for search results...")
+        await page.wait_for_selector(PLACE_LINK_SELECTOR, timeout=10000)
+    except Exception as e:
+        logger.warning(f"No results found in this grid cell: {e}")
+        await mark_cell_collected(cell_id, [], job)
+        return []
+
+    # Scroll the feed inside the page until enough cards load or it stalls
+    target = min(120, job.total - job.results_count)
+    print(f"[{cell_id}] Starting to scroll for results...")
+    found = await page.evaluate(SCROLL_FEED_JS, {
+        "feed": RESULTS_FEED_SELECTOR,
+        "link": PLACE_LINK_SELECTOR,
+        "target": target,
+        "maxStalls": 5,
+        "stallTimeout": 4000,
+        "budget": max(0, deadline - asyncio.get_running_loop().time()) * 1000,
+    })
+    print(f"[{cell_id}] Currently Found: {found}")
+    if asyncio.get_running_loop().time() >= deadline:
+        logger.warning(f"Grid cell {cell_id} used its {CELL_TIMEOUT}s budget, keeping {found} results")
+
+    # Read every rendered listing href in one call instead of clicking through them
+    hrefs = await page.eval_on_selector_all(
+        PLACE_LINK_SELECTOR,
+        "els => els.filter(e => e.getClientRects().length > 0).map(e => e.href)",
+    )
+    logger.info(f"[{cell_id}] Collected {len(hrefs)} listing URLs")
+    await mark_cell_collected(cell_id, hrefs, job)
+    return hrefs
+
+
+async def collect_cell_urls(pool, cell_index, lat, lng, zoom, cell_total, job, logger):
+    """Search one grid cell on a pooled browser context and collect its listing URLs"""
+    cell_id = f"{cell_index+1}/{cell_total}"
+    if cell_id in job.completed_cells:
+        logger.info(f"Skipping already processed grid cell {cell_id}")
+        return []
+
+    # Waiting on the pool also bounds how many cells run at once
+    context = await pool.acquire()
+    logger.info(f"Searching grid cell {cell_id}...")
+    page = await context.new_page()
+    hrefs = []
+
+    try:
+        hrefs = await search_cell(page, cell_id, lat, lng, zoom, job, logger)
+    except Exception as e:
+        print(f"Error processing grid cell {cell_id}: {e}")
+    finally:
+        # Keep the context alive for the next cell, only the page is dropped
+        await page.close()
+        await pool.release(context)
+
+    return hrefs
+
+
+async def load_listing_details(page, url, logger):
+    """Open a listing URL and return its detail fields"""
+    # Navigate directly to the URL
+    logger.debug("Navigating to listing: %.50s...", url)
+    # The sidebar is all we read, so don't wait for the map canvas to finish loading
+    await page.goto(url, wait_until="domcontentloaded")
+
+    # Wait for details to load
+    logger.debug("Waiting for listing details...")
+    await page.wait_for_selector(NAME_SELECTOR, timeout=10000)
+    logger.debug("Details loaded successfully")
+
+    # Resolve every detail field in a single round-trip
+    return await page.evaluate(DETAIL_FIELDS_JS, DETAIL_FIELDS)
+
+
+async def load_listing_details_with_retry(page, url, logger):
+    """Load a listing's details, retrying transient Playwright failures with backoff"""
+    for attempt in range(MAX_DETAIL_ATTEMPTS):
+        try:
+            return await asyncio.wait_for(load_listing_details(page, url, logger), timeout=DETAIL_TIMEOUT)
+        except TRANSIENT_ERRORS as e:
+            if attempt == MAX_DETAIL_ATTEMPTS - 1:
+                raise
+            delay = 0.5 * 2 ** attempt
+            logger.warning(f"Attempt {attempt+1}/{MAX_DETAIL_ATTEMPTS} failed for {url[:50]}...: {e}. Retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+
+def log_failed_listing(url, error, filename='errors.jsonl'):
+    """Append a listing that could not be scraped to the errors log"""
+    with open(filename, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({"url": url, "error": str(error), "time": datetime.datetime.now().isoformat()}) + "\n")
+
+
+async def scrape_listing(page, data, url, place_id, job, logger):
+    """Parse a loaded listing's details, extract its reviews and append it to the CSV.
+
+    Returns False when the listing was dropped because the target was already reached.
+    """
+    name = data['name']
+    address = data['address']
+    website = f"https://{data['website']}" if data['website'] else ""
+    phone_number = data['phone']
+    place_type = data['placeType']
+    introduction = data['intro'] or "None Found"
+    review_count = ""
+    review_average = ""
+    opens_at = ""
+    reviews_extracted = False
+
+    if data['reviewsCount']:
+        temp = data['reviewsCount'].translate(PAREN_COMMA_TABLE)
+        try:
+            review_count = int(temp)
+            raw_rating = data['reviewsAvg']
+            if raw_rating:
+                logger.debug("Found raw rating: %s", raw_rating)
+                # Extract numeric value from German rating text
+                matches = RATING_RE.search(raw_rating)
+                if matches:
+                    review_average = float(matches.group(1).translate(DECIMAL_COMMA_TABLE))
+                    logger.debug("Successfully extracted review average: %s", review_average)
+
+            # Now get review summary
+            logger.debug("Total reviews available: %d", review_count)
+            max_reviews_to_get = min(review_count, 100)  # Cap at 100 reviews per business
+
+            reviews = await extract_reviews(page, name, address, place_id,
+                                   total_reviews_count=review_count,
+                                   max_reviews=max_reviews_to_get)
+            reviews_extracted = True
+            if reviews:
+                job.review_writer.write(reviews)
+        except ValueError:
+            review_count = ""
+
+    # Process additional data for store info
+    store_shopping, in_store_pickup, store_delivery = classify_service_info(data['info'])
+
+    if data['opens']:
+        opens = data['opens'].split(OPENS_SEP)
+        opens = opens[1] if len(opens) != 1 else data['opens']
+        opens_at = opens.translate(NARROW_NBSP_TABLE)
+
+
+    # Without a parsable review count the reviews above were skipped, so
+    # fall back to a small sample; each listing's reviews are written once
+    if not reviews_extracted and job.results_count < job.total:
+        logger.debug("Extracting reviews for this business...")
+        reviews = await extract_reviews(page, name, address, place_id, max_reviews=10)
+        if reviews:
+            job.review_writer.write(reviews)
+
+
+    # Create record and save to CSV
+    row = Row(
+        place_id=place_id,
+        name=name,
+        website=website,
+        introduction=introduction,
+        phone=phone_number,
+        address=address,
+        maps_url=url,
+        reviews_count=review_count,
+        reviews_avg=review_average,
+        store_shopping=store_shopping,
+        in_store_pickup=in_store_pickup,
+        delivery=store_delivery,
+        place_type=place_type,
+        opens_at=opens_at,
+    )
+
+
+    # Log all extracted data (debug only, it is several lines per listing)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Extracted Data Summary:")
+        logger.debug("Name: %s", name)
+        logger.debug("Address: %s", address)
+        logger.debug("Review Count: %s", review_count)
+        logger.debug("Review Average: %s", review_average)
+        logger.debug("Introduction: %.100s...", introduction)
+
+
+    # Other workers may have filled the target while this page was loading
+    if job.results_count >= job.total:
+        logger.info(f"Target of {job.total} reached, dropping {name}")
+        return False
+
+    # Append to CSV immediately and only increment count if successful
+    if job.writer.write(row.to_record()):
+        job.results_count += 1
+        job.progress["results_count"] = job.results_count
+        job.checkpoint()
+        logger.info("Processed %d/%d listings", job.results_count, job.total)
+    else:
+        logger.debug("Duplicate skipped. Still at %d/%d listings", job.results_count, job.total)
+    return True
+
+
+async def scrape_listings(pool, listings, job, logger):
+    """Scrape the detail pages of (place_id, url) pairs concurrently on pooled contexts.
+
+    Each worker keeps two pages open in its context and starts loading the next
+    listing on one while the current listing is parsed on the other.
+    """
+    counts = {"processed": 0, "errors": 0}
+    pending = iter(enumerate(listings))
+    # Claimed listings that are not finished yet; no more are claimed once
+    # these could fill the target on their own
+    in_flight = 0
+    claims = asyncio.Condition(job.lock)
+
+    async def claim_next(wait=False):
+        # Hand out the next unseen listing, or None when there is none or the
+        # claims in flight could already reach the target. With wait=True the
+        # caller waits for those claims to finish instead of giving up.
+        nonlocal in_flight
+        async with claims:
+            while job.results_count + in_flight >= job.total:
+                if not wait or in_flight == 0:
+                    return None
+                await claims.wait()
+            for idx, (place_id, url) in pending:
+                if place_id in job.seen_urls:
+                    continue
+                job.mark_seen(place_id)
+                in_flight += 1
+                return idx, place_id, url
+        return None
+
+    async def finish_claim(place_id, release):
+        # Retire a claim; a released listing is unmarked so a resumed run tries it again
+        nonlocal in_flight
+        async with claims:
+            if release:
+                job.unmark_seen(place_id)
+            in_flight -= 1
+            claims.notify_all()
+
+    def prefetch(page, item):
+        if item is None:
+            return None
+        return asyncio.create_task(load_listing_details_with_retry(page, item[2], logger))
+
+    async def scrape_detail(page, item, loading):
+        idx, place_id, url = item
+        kept = False
+        try:
+            logger.debug("Processing listing %d/%d", idx + 1, len(listings))
+            data = await loading
+            kept = await scrape_listing(page, data, url, place_id, job, logger)
+            counts["processed"] += 1
+        except Exception as e:
+            logger.error(f"Error processing URL {idx+1}: {e}")
+            counts["errors"] += 1
+            log_failed_listing(url, e)
+        finally:
+            await finish_claim(place_id, release=not kept)
+
+    async def worker():
+        item = await claim_next(wait=True)
+        while item:
+            # Hold a context for up to recycle_after listings, then hand it back
+            # so the pool can replace it
+            context = await pool.acquire()
+            pages = [await context.new_page(), await context.new_page()]
+            loading = prefetch(pages[0], item)
+            handled = 0
+            try:
+                while item and handled < pool.recycle_after:
+                    next_item = await claim_next()
+                    last = handled == pool.recycle_after - 1
+                    next_loading = None if last else prefetch(pages[1], next_item)
+                    await scrape_detail(pages[0], item, loading)
+                    handled += 1
+                    pages.reverse()
+                    item, loading = next_item, next_loading
+            finally:
+                if loading is not None and not loading.done():
+                    loading.cancel()
+                for page in pages:
+                    await page.close()
+                await pool.release(context, uses=handled)
+            if item is None:
+                # Claims in flight may still fail or turn out to be duplicates,
+                # so wait for them before giving up on the remaining listings
+                item = await claim_next(wait=True)
+
+    await asyncio.gather(*(worker() for _ in range(pool.size)))
+
+    logger.info(f"Processed: {counts['processed']}, Errors: {counts['errors']}")
+    logger.info(f"Current progress: {job.results_count}/{job.total} unique listings collected")
+
+
+async def main(search_for, total, bounds, grid_size, concurrency, zoom=12, headless=True,
+               detail_concurrency=6, cdp_url=None, executable_path=None, log_level="INFO",
+               no_sandbox=False):
     # Set up logging
-    logger = setup_logging()
+    logger = setup_logging(getattr(logging, log_level))
     logger.info(f"Starting Google Maps scraper with search term: '{search_for}', target: {total} results")
-    logger.info(f"Bounds: {bounds}, Grid size: {grid_size}x{grid_size}")
+    logger.info(f"Bounds: {bounds}, Grid size: {grid_size}x{grid_size}, Concurrency: {concurrency} cells, {detail_concurrency} details")
+
+    async with async_playwright() as p:
+        if cdp_url:
+            # Attach to an already running Chrome (started with
+            # --remote-debugging-port) to skip the cold browser start
+            logger.info(f"Connecting to running browser at {cdp_url}")
+            browser = await p.chromium.connect_over_cdp(cdp_url)
+        else:
+            # The renderer sandbox stays on unless explicitly disabled, e.g.
+            # for containers that run Chrome as root
+            args = CHROMIUM_ARGS + ["--no-sandbox"] if no_sandbox else CHROMIUM_ARGS
+            launch_kwargs = {"headless": headless, "args": args}
+            # Fall back to a system Chrome, then to Playwright's bundled Chromium
+            resolved_path = resolve_chrome_binary(executable_path)
+            if resolved_path:
+                launch_kwargs["executable_path"] = resolved_path
+                logger.info(f"Using Chrome executable at {resolved_path}")
+            elif executable_path:
+                logger.warning(f"Chrome executable not found: {executable_path}. Using Playwright managed Chromium")
+            browser = await p.chromium.launch(**launch_kwargs)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(executable_path='C:\Program Files\Google\Chrome\Application\chrome.exe', headless=False)
-        page = browser.new_page()
-        
         # Load progress if continuing a job
         progress = load_progress()
-        
+
         # Initialize or load progress data
         if progress["search_term"] == search_for and progress["bounds"] == list(bounds) and progress["grid_size"] == grid_size:
             # Continuing previous job
             completed_cells = progress["completed_cells"]
-            seen_urls = set(progress["seen_urls"])
+            # Older progress files kept the seen IDs and pending URLs inline
+            seen_urls = load_seen_ids() | set(progress.pop("seen_urls", []))
+            pending_urls = progress.pop("pending_urls", []) + load_pending_urls()
             results_count = progress["results_count"]
             print(f"Continuing job: {results_count}/{total} results already collected")
         else:
             # New job
             completed_cells = []
             seen_urls = set()
+            pending_urls = []
             results_count = 0
             progress = {
                 "completed_cells": completed_cells,
-                "seen_urls": list(seen_urls),
                 "results_count": results_count,
                 "search_term": search_for,
                 "bounds": list(bounds),
@@ -541,509 +1320,101 @@ def main():
                 "total_target": total
             }
             save_progress(progress)
-            
+
             # Create a new CSV file if starting a new job
             if os.path.exists('result.csv'):
                 os.rename('result.csv', f'result_{time.strftime("%Y%m%d%H%M%S")}.csv')
-        
+
         # After loading progress, synchronize with actual CSV records:
+        writer = ResultWriter('result.csv')
+        if writer.count != results_count:
+            print(f"WARNING: Progress count ({results_count}) differs from actual CSV record count ({writer.count})")
+            results_count = writer.count
+            progress["results_count"] = results_count
+            save_progress(progress)
+
+        job = JobState(
+            search_for=search_for,
+            total=total,
+            progress=progress,
+            completed_cells=completed_cells,
+            seen_urls=seen_urls,
+            results_count=results_count,
+            writer=writer,
+            review_writer=ReviewWriter('reviews.csv'),
+            seen_file=write_seen_ids(seen_urls),
+            pending_urls=pending_urls,
+            pending_file=write_pending_urls(pending_urls),
+            progress_writer=ProgressWriter(),
+        )
 
-        try:
-            if os.path.exists('result.csv'):
-                df = pd.read_csv('result.csv')
-                actual_count = len(df)
-                if actual_count != results_count:
-                    print(f"WARNING: Progress count ({results_count}) differs from actual CSV record count ({actual_count})")
-                    results_count = actual_count
-                    progress["results_count"] = results_count
-                    save_progress(progress)
-        except Exception as e:
-            print(f"Error checking CSV record count: {e}")
-        
         # Define the search area bounds
         search_bounds = bounds
-        
-        # Generate grid points
-        grid_points = generate_grid(search_bounds, grid_size=grid_size)
-        
-        print(f"Split search into {len(grid_points)} grid areas")
-        
-        # For each grid point, perform a search
-        for i, (lat, lng, zoom) in enumerate(grid_points):
-            # Skip already completed cells
-            cell_id = f"{i+1}/{len(grid_points)}"
-            if cell_id in completed_cells:
-                logger.info(f"Skipping already processed grid cell {cell_id}")
-                continue
-                
-            logger.info(f"Searching grid cell {cell_id}...")
-            
-            try:
-                # Go to Google Maps with specific coordinates and zoom level
-                logger.info(f"Navigating to Google Maps at coordinates: {lat}, {lng}, zoom: {zoom}")
-                page.goto(f"https://www.google.com/maps/@{lat},{lng},{zoom}z", timeout=60000)
-                page.wait_for_timeout(1000)
-                
-                # Perform the search
-                logger.info(f"Searching for: '{search_for}'")
-                page.locator('//input[@id="searchboxinput"]').fill(search_for)
-                page.keyboard.press("Enter")
-                
-                try:
-                    logger.info("Waiting for search results...")
-                    page.wait_for_selector('//a[contains(@href, "https://www.google.com/maps/place")]', timeout=10000)
-                except Exception as e:
-                    logger.warning(f"No results found in this grid cell: {e}")
-                    completed_cells.append(cell_id)
-                    progress["completed_cells"] = completed_cells
-                    save_progress(progress)
-                    continue
-                
-                # Your existing scroll logic
-                results_selector = '[role="feed"]'
-                previously_counted = 0
-                max_attempts = 5  # Reduced from 5
-                static_count_attempts = 0
-                scroll_interval = 1500  # Reduced from 3000ms
-                
-                print("Starting to scroll for results...")
-                
-                while static_count_attempts < max_attempts:
-                    current_count = page.locator('//a[contains(@href, "https://www.google.com/maps/place")]').count()
-                    print(f"Currently Found: {current_count}")
-                    
-                    # Stop earlier if we find enough results
-                    if current_count >= min(120, total - results_count):  # Increased from 100
-                        print(f"Found sufficient results ({current_count}) in this grid cell")
-                        break
-                        
-                    if current_count == previously_counted:
-                        static_count_attempts += 1
-                        print(f"No new results found. Attempt {static_count_attempts}/{max_attempts}")
-                    else:
-                        static_count_attempts = 0
-                        previously_counted = current_count
-                    
-                    # More aggressive scrolling
-                    if page.locator(results_selector).count() > 0:
-                        try:
-                            page.evaluate("""(selector) => {
-                                const element = document.querySelector(selector);
-                                if (element) {
-                                    element.scrollTop = element.scrollHeight;
-                                }
-                            }""", results_selector)
-                        except:
-                            page.mouse.wheel(0, 20000)  # Increased scroll distance
-                    else:
-                        page.mouse.wheel(0, 20000)  # Increased scroll distance
-                    
-                    page.wait_for_timeout(scroll_interval)
-                    
-                    # Break early if we've scrolled enough
-                    if current_count > 40 and static_count_attempts >= 2:
-                        print("Breaking early - sufficient results found")
-                        break
-                
-                # Improved listing collection with detailed logging
-                try:
-                    logger.info("Collecting listings...")
-                    
-                    # Get all potential listing elements
-                    all_listings = page.locator('//a[contains(@href, "https://www.google.com/maps/place")]').all()
-                    logger.info(f"Found {len(all_listings)} total listing elements")
-                    
-                    # Filter to only visible and accessible listings
-                    grid_listings = []
-                    invalid_listings = 0
-                    invisible_listings = 0
-                    
-                    for idx, listing in enumerate(all_listings):
-                        try:
-                            if idx < 10 or idx % 10 == 0:  # Log first 10 and every 10th after that
-                                logger.debug(f"Checking listing {idx+1}/{len(all_listings)}...")
-                            
-                            # Check if visible
-                            is_visible = listing.is_visible()
-                            if not is_visible:
-                                invisible_listings += 1
-                                continue
-                            
-                            # Try to get the href (with shorter timeout)
-                            try:
-                                href = listing.get_attribute('href', timeout=3000)
-                                if href:
-                                    grid_listings.append(listing)
-                                else:
-                                    invalid_listings += 1
-                            except Exception:
-                                invalid_listings += 1
-                        except Exception as e:
-                            logger.error(f"Error checking listing {idx}: {e}")
-                    
-                    logger.info(f"Results: {len(all_listings)} total, {invisible_listings} invisible, " +
-                                f"{invalid_listings} invalid, {len(grid_listings)} usable")
-                except Exception as e:
-                    logger.error(f"Error collecting listings: {e}")
-                    grid_listings = []
-                
-                # Process listings with better error handling and logging
-                processed_count = 0
-                skipped_count = 0
-                error_count = 0
 
-                # Replace the inner listing processing loop with this improved approach:
+        # Generate grid points
+        grid_points = generate_grid(search_bounds, grid_size=grid_size, zoom=zoom)
 
-                try:
-                    # First collect all listing URLs without clicking on them
-                    logger.info("Collecting all listing URLs...")
-                    all_listing_urls = []
-                    all_listing_ids = []
-                    
-                    # Wait for listings to be available
-                    page.wait_for_selector('//a[contains(@href, "https://www.google.com/maps/place")]', timeout=5000)
-                    
-                    # Get all URLs first
-                    all_listings = page.locator('//a[contains(@href, "https://www.google.com/maps/place")]').all()
-                    logger.info(f"Found {len(all_listings)} total listing elements")
-                    
-                    # Extract URLs and IDs first (without clicking)
-                    for idx, listing in enumerate(all_listings):
-                        try:
-                            url = listing.get_attribute('href', timeout=3000)
-                            place_id = extract_place_id(url)
-                            
-                            # Only add if not already seen
-                            if place_id not in seen_urls:
-                                all_listing_urls.append(url)
-                                all_listing_ids.append(place_id)
-                                logger.info(f"Added URL #{len(all_listing_urls)}: {url[:50]}... (ID: {place_id[:15]}...)")
-                            else:
-                                logger.info(f"Skipping already seen ID: {place_id[:15]}...")
-                        except Exception as e:
-                            logger.error(f"Error extracting URL {idx}: {e}")
-                    
-                    logger.info(f"Collected {len(all_listing_urls)} unique URLs to process")
-
-                    # Define maximum listings to process per grid cell
-                    max_listings_per_cell = 120  # Adjust this value based on your needs
-                    
-                    # Now process each URL directly
-                    for idx, (url, place_id) in enumerate(zip(all_listing_urls, all_listing_ids)):
-                        if results_count >= total:
-                            logger.info(f"Reached target of {total} results, stopping")
-                            break
-                            
-                        if idx >= max_listings_per_cell:
-                            logger.info(f"Reached max of {max_listings_per_cell} listings for this cell, moving to next cell")
-                            break
-                        
-                        try:
-                            # Mark as seen before processing
-                            seen_urls.add(place_id)
-                            progress["seen_urls"] = list(seen_urls)
-                            save_progress(progress)
-                            
-                            # Navigate directly to the URL
-                            logger.info(f"Navigating to listing {idx+1}/{len(all_listing_urls)}: {url[:50]}...")
-                            page.goto(url, timeout=30000)
-                            
-                            # Wait for details to load
-                            logger.info("Waiting for listing details...")
-                            page.wait_for_selector('//div[@class="TIHn2 "]//h1[@class="DUwDvf lfPIob"]', timeout=10000)
-                            logger.info("Details loaded successfully")
-                            
-                            # Process the listing data - your existing extraction code here
-                            name_xpath = '//div[@class="TIHn2 "]//h1[@class="DUwDvf lfPIob"]'
-                            address_xpath = '//button[@data-item-id="address"]//div[contains(@class, "fontBodyMedium")]'
-                            website_xpath = '//a[@data-item-id="authority"]//div[contains(@class, "fontBodyMedium")]'
-                            phone_number_xpath = '//button[contains(@data-item-id, "phone:tel:")]//div[contains(@class, "fontBodyMedium")]'
-                            reviews_count_xpath = '//div[@class="TIHn2 "]//div[@class="fontBodyMedium dmRWX"]//div//span//span//span[@aria-label]'
-                            # Updated selectors for review average
-                            reviews_average_selectors = [
-                                '//*[@id="QA0Szd"]/div/div/div[1]/div[2]/div/div[1]/div/div/div[2]/div/div[1]/div[2]/div/div[1]/div[2]/span[1]/span[1]',
-                                '//div[@class="F7nice"]//span[1]/span[1]',
-                                '//div[@class="fontBodyMedium dmRWX"]//span[@aria-hidden and contains(text(), ",")]'
-                            ]
-                            # Updated selectors for introduction
-                            intro_selectors = [
-                                '//*[@id="QA0Szd"]/div/div/div[1]/div[2]/div/div[1]/div/div/div[8]/button/div[3]/div/div[1]',
-                                '//div[@class="WeS02d fontBodyMedium"]//div[@class="PYvSYb"]',
-                                '//button//div[@class="WeS02d fontBodyMedium"]//div[@class="PYvSYb"]'
-                            ]
-                            place_type_xpath='//div[@class="LBgpqf"]//button[@class="DkEaL "]'
-                            intro_xpath='//div[@class="WeS02d fontBodyMedium"]//div[@class="PYvSYb "]'
-                            info1='//div[@class="LTs0Rc"][1]'
-                            info2='//div[@class="LTs0Rc"][2]'
-                            info3='//div[@class="LTs0Rc"][3]'
-
-                            opens_at_xpath='//button[contains(@data-item-id, "oh")]//div[contains(@class, "fontBodyMedium")]'
-                            opens_at_xpath2='//div[@class="MkV9"]//span[@class="ZDu9vd"]//span[2]'
-                            # Reset temporary data for this listing
-                            name = ""
-                            address = ""
-                            website = ""
-                            phone_number = ""
-                            review_count = ""
-                            review_average = ""
-                            store_shopping = "No"
-                            in_store_pickup = "No"
-                            store_delivery = "No"
-                            place_type = ""
-                            opens_at = ""
-                            introduction = "None Found"
-                            
-                            # Extract data with error handling
-                            if page.locator(name_xpath).count() > 0:
-                                name = page.locator(name_xpath).inner_text()
-                                
-                            if page.locator(address_xpath).count() > 0:
-                                address = page.locator(address_xpath).inner_text()
-                                
-                            if page.locator(website_xpath).count() > 0:
-                                website = page.locator(website_xpath).inner_text()
-                                website = f"https://{website}" if website else ""
-                                
-                            if page.locator(phone_number_xpath).count() > 0:
-                                phone_number = page.locator(phone_number_xpath).inner_text()
-                                
-                            if page.locator(place_type_xpath).count() > 0:
-                                place_type = page.locator(place_type_xpath).inner_text()
-                            
-                            if page.locator(intro_xpath).count() > 0:
-                                introduction = page.locator(intro_xpath).inner_text()
-                            
-                            if page.locator(reviews_count_xpath).count() > 0:
-                                temp = page.locator(reviews_count_xpath).inner_text()
-                                temp = temp.replace('(','').replace(')','').replace(',','')
-                                try:
-                                    review_count = int(temp)
-                                    # Extract review average using a more specific selector
-                                    rating_selector = '//span[@role="img" and contains(@class, "ceNzKf") and contains(@aria-label, "Sterne")]'
-                                    if page.locator(rating_selector).count() > 0:
-                                        raw_rating = page.locator(rating_selector).first.get_attribute('aria-label')
-                                        logger.info(f"Found raw rating: {raw_rating}")
-                                        if raw_rating:
-                                            # Extract numeric value from German rating text
-                                            matches = re.search(r'(\d+[.,]\d+|\d+)', raw_rating)
-                                            if matches:
-                                                review_average = float(matches.group(1).replace(',', '.'))
-                                                logger.info(f"Successfully extracted review average: {review_average}")
-                                    
-                                    # Now get review summary
-                                    logger.info(f"Total reviews available: {review_count}")
-                                    max_reviews_to_get = min(review_count, 100)  # Cap at 100 reviews per business
-                                    
-                                    reviews = extract_reviews(page, name, address, place_id, 
-                                                           total_reviews_count=review_count,
-                                                           max_reviews=max_reviews_to_get)
-                                    if reviews:
-                                        save_reviews_to_csv(reviews)
-                                except ValueError:
-                                    review_count = ""
-                            
-
-
-
-                            
-                            # Process additional data for store info
-                            # For info1
-                            if page.locator(info1).count() > 0:
-                                try:
-                                    temp = page.locator(info1).inner_text(timeout=5000)  # Reduced timeout
-                                    if '·' in temp:
-                                        temp = temp.split('·')
-                                        if len(temp) > 1:  # Make sure split was successful
-                                            check = temp[1].replace("\n", "")
-                                            if 'shop' in check:
-                                                store_shopping = "Yes"
-                                            elif 'pickup' in check:
-                                                in_store_pickup = "Yes"
-                                            elif 'delivery' in check:
-                                                store_delivery = "Yes"
-                                except Exception:
-                                    store_shopping = "No"
-                            else:
-                                store_shopping = "No"
-
-
-                            # Apply similar pattern for info2 and info3
-                            if page.locator(info2).count() > 0:
-                                try:
-                                    temp = page.locator(info2).inner_text(timeout=5000)  # Reduced timeout
-                                    if '·' in temp:
-                                        temp = temp.split('·')
-                                        if len(temp) > 1:  # Make sure split was successful
-                                            check = temp[1].replace("\n", "")
-                                            if 'pickup' in check:
-                                                in_store_pickup = "Yes"
-                                            elif 'shop' in check:
-                                                store_shopping = "Yes"
-                                            elif 'delivery' in check:
-                                                store_delivery = "Yes"
-                                except Exception:
-                                    in_store_pickup = "No"
-                            else:
-                                in_store_pickup = "No"
-
-                            if page.locator(info3).count() > 0:
-                                try:
-                                    temp = page.locator(info3).inner_text(timeout=5000)  # Reduced timeout
-                                    if '·' in temp:
-                                        temp = temp.split('·')
-                                        if len(temp) > 1:  # Make sure split was successful
-                                            check = temp[1].replace("\n", "")
-                                            if 'Delivery' in check:
-                                                store_delivery = "Yes"
-                                            elif 'pickup' in check:
-                                                in_store_pickup = "Yes"
-                                            elif 'shop' in check:
-                                                store_shopping = "Yes"
-                                except Exception:
-                                    store_delivery = "No"
-                            else:
-                                store_delivery = "No"
-                            
-                            if page.locator(opens_at_xpath).count() > 0:
-                                opens = page.locator(opens_at_xpath).inner_text()
-                                opens = opens.split('⋅')
-                                if len(opens) != 1:
-                                    opens = opens[1]
-                                else:
-                                    opens = page.locator(opens_at_xpath).inner_text()
-                                opens = opens.replace("\u202f", "")
-                                opens_at = opens
-                            
-
-                            # After extracting all the business data, extract reviews
-                            if results_count < total:  # Only extract reviews if we're still collecting results
-                                logger.info("Extracting reviews for this business...")
-                                reviews = extract_reviews(page, name, address, place_id, max_reviews=10)
-                                if reviews:
-                                    save_reviews_to_csv(reviews)
-                            
-
-                            # Create record and save to CSV
-                            record = {
-                                'Place ID': place_id,
-                                'Names': name,
-                                'Website': website,
-                                'Introduction': introduction,
-                                'Phone Number': phone_number,
-                                'Address': address,
-                                'Maps URL': url,  # Add the Maps URL to the record
-                                'Review Count': review_count,
-                                'Average Review': review_average,  # Updated field name
-                                'Store Shopping': store_shopping,
-                                'In Store Pickup': in_store_pickup,
-                                'Delivery': store_delivery,
-                                'Type': place_type,
-                                'Opens At': opens_at
-                            }
-                            
-
-                            # Log all extracted data
-                            logger.info("Extracted Data Summary:")
-                            logger.info(f"Name: {name}")
-                            logger.info(f"Address: {address}")
-                            logger.info(f"Review Count: {review_count}")
-                            logger.info(f"Review Average: {review_average}")
-                            logger.info(f"Introduction: {introduction[:100]}...")
-                            
-
-                            # Append to CSV immediately and only increment count if successful
-                            if append_to_csv(record):
-                                results_count += 1
-                                progress["results_count"] = results_count
-                                logger.info(f"Processed {results_count}/{total} listings")
-                            else:
-                                logger.info(f"Duplicate skipped. Still at {results_count}/{total} listings")
-                            
-
-                            # Increment processed count
-                            processed_count += 1
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing URL {idx+1}: {e}")
-                            error_count += 1
-                    
-                    
-
-                    # After processing all URLs for this grid cell, return to search for next cell
-                    logger.info("Finished processing URLs for this grid cell")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to collect listings: {e}")
-                
-                
+        print(f"Split search into {len(grid_points)} grid areas")
 
-                # After processing all listings in a grid cell:
+        try:
+            pool = ContextPool(browser, size=concurrency)
+            await pool.start()
 
+            # Pass 1: search every grid cell in parallel and only collect hrefs.
+            # URLs are persisted per cell, so on resume this also picks up the
+            # ones collected before a crash.
+            await asyncio.gather(*(
+                collect_cell_urls(pool, i, lat, lng, zoom, len(grid_points), job, logger)
+                for i, (lat, lng, zoom) in enumerate(grid_points)
+            ))
+            all_urls = job.pending_urls
+            unique_urls = list(dict.fromkeys(all_urls))
 
+            # Overlapping cells return the same place under different URLs, so
+            # key on the place ID and drop anything scraped in an earlier run
+            listings = {}
+            for url in unique_urls:
+                place_id = extract_place_id(url)
+                if place_id not in job.seen_urls:
+                    listings.setdefault(place_id, url)
+            print(f"Collected {len(all_urls)} URLs, {len(listings)} unique listings to scrape")
+            await pool.close()
 
-                # Log cell processing summary 
-                logger.info(f"\n=== Grid Cell {cell_id} Summary ===")
-                logger.info(f"Total listings found: {len(grid_listings)}")
-                logger.info(f"Processed: {processed_count}, Skipped: {skipped_count}, Errors: {error_count}")
-                logger.info(f"Current progress: {results_count}/{total} unique listings collected")
-                logger.info("=====================================\n")
+            # Pass 2: detail-scrape each unique listing once, in parallel. Detail
+            # pages are lighter than map searches, so they get their own pool size.
+            detail_pool = ContextPool(browser, size=detail_concurrency)
+            await detail_pool.start()
+            await scrape_listings(detail_pool, list(listings.items()), job, logger)
+            await detail_pool.close()
+            writer.close()
+            job.review_writer.close()
+        finally:
+            # Write whatever the debounced checkpoints have not saved yet,
+            # also when the run is interrupted
+            job.checkpoint(force=True)
+            job.seen_file.close()
+            job.pending_file.close()
 
-                
+        # Keep only listings that were never scraped or were released after
+        # failing, so a rerun retries them even though their cells are done
+        write_pending_urls(
+            url for place_id, url in listings.items() if place_id not in job.seen_urls
+        ).close()
 
-                # Mark cell as completed
-                completed_cells.append(cell_id)
-                progress["completed_cells"] = completed_cells
-                save_progress(progress)
-                
-                if results_count >= total:
-                    break
-                    
-            except Exception as e:
-                print(f"Error processing grid cell {cell_id}: {e}")
-                # Continue to next cell on error
-                continue
-        
-        
-
-        # Finalize the CSV (remove duplicates if any)
-        try:
-            df = pd.read_csv('result.csv')
-            df = df.drop_duplicates(subset=['Names', 'Address'])
-            
-            
+        # For an attached browser this only disconnects and leaves Chrome running
+        await browser.close()
 
-            # Remove columns with only one unique value
-            for column in df.columns:
-                if df[column].nunique() == 1:
-                    df.drop(column, axis=1, inplace=True)
-                    
-            df.to_csv('result.csv', index=False)
-            print(f"Final dataset contains {len(df)} unique listings")
-            print(df.head())
-        except Exception as e:
-            print(f"Error finalizing CSV: {e}")
-        
-        browser.close()
-                            
-
-    # Final deduplication of the CSV - using BOTH Name and Address
+    # Duplicates are rejected on write, so finalizing only prunes columns
+    # that hold a single value across the whole dataset. A job below its
+    # target is resumed later, so its columns are left alone until then.
     try:
-        print("Performing final deduplication of results...")
-        df = pd.read_csv('result.csv')
-        original_count = len(df)
-        
-        
-
-        # Remove duplicates based on both name and address
-        df = df.drop_duplicates(subset=['Names', 'Address'])
-        
-        
-
-        # Save the deduplicated data
-        df.to_csv('result.csv', index=False)
-        print(f"Removed {original_count - len(df)} duplicate entries. Final dataset contains {len(df)} unique listings.")
+        if job.results_count >= total:
+            dropped = writer.prune_constant_columns()
+            if dropped:
+                print(f"Removed single-value columns: {', '.join(dropped)}")
+        print(f"Final dataset contains {writer.count} unique listings")
     except Exception as e:
-        print(f"Error during final deduplication: {e}")
+        print(f"Error finalizing CSV: {e}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -1051,11 +1422,18 @@ if __name__ == "__main__":
     parser.add_argument("-t", "--total", type=int, help="Total number of results to collect")
     parser.add_argument("-b", "--bounds", type=str, help="Search bounds in format 'min_lat,min_lng,max_lat,max_lng'")
     parser.add_argument("-g", "--grid", type=int, default=2, help="Grid size (default: 2x2)")
+    parser.add_argument("-z", "--zoom", type=int, default=12, help="Map zoom level per grid cell (default: 12)")
+    parser.add_argument("--headful", action="store_true", help="Show the browser window instead of running headless")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="Grid cells scraped in parallel (default: 4)")
+    parser.add_argument("-p", "--detail-concurrency", type=int, default=6, help="Listing detail pages scraped in parallel (default: 6)")
+    parser.add_argument("--cdp-url", type=str, help="Attach to a running Chrome instead of launching one (e.g. http://localhost:9222)")
+    parser.add_argument("--executable-path", type=str, default=os.getenv("CHROME_PATH"), help="Chrome/Chromium executable (default: $CHROME_PATH, then auto-detect)")
+    parser.add_argument("--no-sandbox", action="store_true", default=os.getenv("CHROME_NO_SANDBOX") == "1", help="Disable Chrome's renderer sandbox, only for root/container runs (default: off, or $CHROME_NO_SANDBOX=1)")
+    parser.add_argument("--log-level", type=str.upper, default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Logging verbosity; per-listing details are logged at DEBUG (default: INFO)")
     args = parser.parse_args()
     
     search_for = args.search if args.search else "pharmacies in Germany"
     total = args.total if args.total else 50
-    grid_size = args.grid
     
     if args.bounds:
         bounds = tuple(map(float, args.bounds.split(',')))
@@ -1067,4 +1445,7 @@ if __name__ == "__main__":
     
     print(args)
 
-    main()
+    asyncio.run(main(search_for, total, bounds, args.grid, max(1, args.concurrency), args.zoom,
+                     headless=not args.headful, detail_concurrency=max(1, args.detail_concurrency),
+                     cdp_url=args.cdp_url, executable_path=args.executable_path, log_level=args.log_level,
+                     no_sandbox=args.no_sandbox))
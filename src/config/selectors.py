@@ -9,36 +9,35 @@ class Selectors:
     """Container for all XPath and CSS selectors used in scraping."""
     
     # Search and navigation selectors
-    SEARCH_INPUT: str = '//input[@id="searchboxinput"]'
+    SEARCH_INPUT: str = 'input#searchboxinput'
     SEARCH_INPUT_SELECTORS: List[str] = None
-    SEARCH_RESULTS: str = '//a[contains(@href, "https://www.google.com/maps/place")]'
+    SEARCH_RESULTS: str = 'a[href*="https://www.google.com/maps/place"]'
     RESULTS_FEED: str = '[role="feed"]'
     
     # Business information selectors
-    BUSINESS_NAME: str = '//div[@class="TIHn2 "]//h1[@class="DUwDvf lfPIob"]'
-    BUSINESS_ADDRESS: str = '//button[@data-item-id="address"]//div[contains(@class, "fontBodyMedium")]'
-    BUSINESS_WEBSITE: str = '//a[@data-item-id="authority"]//div[contains(@class, "fontBodyMedium")]'
-    BUSINESS_PHONE: str = '//button[contains(@data-item-id, "phone:tel:")]//div[contains(@class, "fontBodyMedium")]'
-    BUSINESS_TYPE: str = '//div[@class="LBgpqf"]//button[@class="DkEaL "]'
-    BUSINESS_INTRO: str = '//div[@class="WeS02d fontBodyMedium"]//div[@class="PYvSYb "]'
+    BUSINESS_NAME: str = 'div.TIHn2 h1.DUwDvf.lfPIob'
+    BUSINESS_ADDRESS: str = 'button[data-item-id="address"] div.fontBodyMedium'
+    BUSINESS_WEBSITE: str = 'a[data-item-id="authority"] div.fontBodyMedium'
+    BUSINESS_PHONE: str = 'button[data-item-id^="phone:tel:"] div.fontBodyMedium'
+    BUSINESS_TYPE: str = 'div.LBgpqf button.DkEaL'
+    BUSINESS_INTRO: str = 'div.WeS02d.fontBodyMedium div.PYvSYb'
+    BUSINESS_INTRO_SELECTORS: List[str] = None
     
     # Review selectors
-    REVIEWS_COUNT: str = '//div[@class="TIHn2 "]//div[@class="fontBodyMedium dmRWX"]//div//span//span//span[@aria-label]'
+    REVIEWS_COUNT: str = 'div.TIHn2 div.fontBodyMedium.dmRWX div span span span[aria-label]'
     REVIEWS_AVERAGE: List[str] = None
-    RATING_SELECTOR: str = '//span[@role="img" and contains(@class, "ceNzKf") and contains(@aria-label, "Sterne")]'
+    RATING_SELECTOR: str = 'span[role="img"].ceNzKf[aria-label*="Sterne"]'
     
     # Operating hours selectors  
-    OPENS_AT: str = '//button[contains(@data-item-id, "oh")]//div[contains(@class, "fontBodyMedium")]'
-    OPENS_AT_ALT: str = '//div[@class="MkV9"]//span[@class="ZDu9vd"]//span[2]'
+    OPENS_AT: str = 'button[data-item-id*="oh"] div.fontBodyMedium'
+    OPENS_AT_ALT: str = 'div.MkV9 span.ZDu9vd span:nth-of-type(2)'
     
     # Service type selectors
-    INFO1: str = '//div[@class="LTs0Rc"][1]'
-    INFO2: str = '//div[@class="LTs0Rc"][2]'  
-    INFO3: str = '//div[@class="LTs0Rc"][3]'
+    SERVICE_INFO: str = 'div.LTs0Rc'
     
     # Review tab and content selectors
     REVIEWS_TAB_SELECTORS: List[str] = None
-    REVIEW_CONTAINERS: str = 'xpath=//div[@class="jftiEf fontBodyMedium "]'
+    REVIEW_CONTAINERS: str = 'div.jftiEf.fontBodyMedium'
     
     # Individual review element selectors
     REVIEWER_NAME_SELECTORS: List[str] = None
@@ -59,45 +58,45 @@ class Selectors:
         """Initialize list selectors after dataclass creation."""
         self.REVIEWS_AVERAGE = [
             '//*[@id="QA0Szd"]/div/div/div[1]/div[2]/div/div[1]/div/div/div[2]/div/div[1]/div[2]/div/div[1]/div[2]/span[1]/span[1]',
-            '//div[@class="F7nice"]//span[1]/span[1]',
+            'div.F7nice span:first-of-type > span:first-of-type',
             '//div[@class="fontBodyMedium dmRWX"]//span[@aria-hidden and contains(text(), ",")]'
         ]
         
+        self.BUSINESS_INTRO_SELECTORS = [
+            self.BUSINESS_INTRO,
+            '//*[@id="QA0Szd"]/div/div/div[1]/div[2]/div/div[1]/div/div/div[8]/button/div[3]/div/div[1]'
+        ]
+        
         self.REVIEWS_TAB_SELECTORS = [
-            'xpath=//button[@role="tab" and contains(@aria-label, "Rezensionen")]',
-            'xpath=//button[@role="tab" and contains(@aria-label, "Reviews")]',
+            'button[role="tab"][aria-label*="Rezensionen"]',
+            'button[role="tab"][aria-label*="Reviews"]',
             'xpath=//button[@role="tab"]//div[contains(text(), "Rezensionen")]/..',
             'xpath=//button[@role="tab"]//div[contains(text(), "Reviews")]/..',
-            'xpath=//button[@role="tab" and @data-tab-index="1"]',
-            'xpath=//button[@jsaction="pane.rating.moreReviews"]'
+            'button[role="tab"][data-tab-index="1"]',
+            'button[jsaction="pane.rating.moreReviews"]'
         ]
         
         self.REVIEWER_NAME_SELECTORS = [
-            'xpath=.//div[contains(@class, "d4r55")]',
             'css=div.d4r55',
             '.d4r55'
         ]
         
         self.REVIEW_TEXT_SELECTORS = [
-            'xpath=.//div[@class="MyEned"]//span[@class="wiI7pd"]',
             'css=div.MyEned span.wiI7pd',
             '.wiI7pd'
         ]
         
         self.REVIEW_STARS_SELECTORS = [
-            'xpath=.//span[@class="kvMYJc"]',
             'css=span.kvMYJc',
             '.kvMYJc'
         ]
         
         self.REVIEW_DATE_SELECTORS = [
-            'xpath=.//span[@class="rsqaWe"]',
             'css=span.rsqaWe', 
             '.rsqaWe'
         ]
         
         self.OWNER_RESPONSE_SELECTORS = [
-            'xpath=.//div[@class="CDe7pd"]//div[@class="wiI7pd"]',
             'css=div.CDe7pd div.wiI7pd',
             'div.CDe7pd .wiI7pd'
         ]
@@ -179,16 +178,15 @@ class Selectors:
         ]
         
         self.SEARCH_INPUT_SELECTORS = [
-            '//input[@id="searchboxinput"]',
             'input#searchboxinput',
             'input[aria-label*="Search"]',
             'input[aria-label*="Suche"]', 
             'input[aria-label*="Recherche"]',
             'input[placeholder*="Search"]',
             'input[placeholder*="Suche"]',
-            '//input[@name="q"]',
+            'input[name="q"]',
             'input.searchboxinput',
             '[data-value="Search"]',
             'input[jsaction*="search"]',
-            '//input[contains(@class, "searchboxinput")]'
+            'input[class*="searchboxinput"]'
         ]
\ No newline at end of file
@@ -19,6 +19,8 @@ class BrowserSettings:
     handle_cookie_banner: bool = True
     cookie_preference: str = "reject"  # "reject" or "accept"
     enable_debug_mode: bool = True
+    block_resources: bool = True  # Abort images, fonts, media and telemetry requests
+    storage_state_file: str = "gmaps_state.json"  # Saved consent cookies; empty disables
 
 
 @dataclass
@@ -123,7 +125,9 @@ class Config:
                 timeout_very_short=browser_data.get('timeout_very_short', settings.browser.timeout_very_short),
                 handle_cookie_banner=browser_data.get('handle_cookie_banner', settings.browser.handle_cookie_banner),
                 cookie_preference=browser_data.get('cookie_preference', settings.browser.cookie_preference),
-                enable_debug_mode=browser_data.get('enable_debug_mode', settings.browser.enable_debug_mode)
+                enable_debug_mode=browser_data.get('enable_debug_mode', settings.browser.enable_debug_mode),
+                block_resources=browser_data.get('block_resources', settings.browser.block_resources),
+                storage_state_file=browser_data.get('storage_state_file', settings.browser.storage_state_file)
             )
         
         # Load scraping settings
@@ -225,7 +229,9 @@ class Config:
                 'timeout_very_short': self.settings.browser.timeout_very_short,
                 'handle_cookie_banner': self.settings.browser.handle_cookie_banner,
                 'cookie_preference': self.settings.browser.cookie_preference,
-                'enable_debug_mode': self.settings.browser.enable_debug_mode
+                'enable_debug_mode': self.settings.browser.enable_debug_mode,
+                'block_resources': self.settings.browser.block_resources,
+                'storage_state_file': self.settings.browser.storage_state_file
             },
             'scraping': {
                 'scroll_interval': self.settings.scraping.scroll_interval,
@@ -1,9 +1,10 @@
 """Main Google Maps scraper orchestrator."""
 
 import os
+import re
 import subprocess
 import sys
-from typing import Callable, Tuple, Optional, List
+from typing import Callable, Tuple, Optional
 from playwright.sync_api import sync_playwright, Browser, Page
 import argparse
 import time
@@ -26,6 +27,36 @@ from .utils.review_analyzer import analyze_reviews
 from .utils.helpers import extract_place_id
 
 
+# Requests the scraper never reads; aborting them keeps page loads light.
+# Stylesheets are kept because the results feed needs its layout to scroll.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "texttrack", "manifest"})
+_BLOCKED_URL_PATTERNS = (
+    "googleadservices",
+    "google-analytics",
+    "doubleclick",
+    "gen_204",
+    "log204",
+    "gstatic.com/mapfiles",
+    "khms",
+    "maps/vt",
+)
+# All URL patterns in one alternation, so each request is a single scan
+_BLOCKED_URL_RE = re.compile("|".join(map(re.escape, _BLOCKED_URL_PATTERNS)))
+
+
+# Fixed window size so Maps always renders the same side-panel layout
+_VIEWPORT = {"width": 1280, "height": 900}
+
+
+def _block_unneeded_requests(route) -> None:
+    """Abort images, fonts, media, map tiles and telemetry requests."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_URL_RE.search(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
 class GoogleMapsScraper:
     """Main scraper orchestrator that coordinates all components."""
     
@@ -133,8 +164,10 @@ class GoogleMapsScraper:
             raise
         finally:
             self._should_cancel_callback = None
+            self.progress_tracker.flush()
             self._cleanup_browser()
             self._finalize_results(context_logger)
+            self.csv_writer.close()
 
     def _check_cancelled(self) -> None:
         """Raise if an external cancellation request was received."""
@@ -160,7 +193,23 @@ class GoogleMapsScraper:
             self.logger.info("No Chrome path provided; using Playwright managed Chromium")
 
         self.browser = playwright.chromium.launch(**launch_kwargs)
-        self.page = self.browser.new_page()
+        
+        # Reuse cookies from an earlier run so Maps skips the consent flow
+        state_file = self.config.settings.browser.storage_state_file
+        storage_state = state_file if state_file and os.path.exists(state_file) else None
+        if storage_state:
+            self.logger.info("Restoring browser storage state from %s", storage_state)
+        # Service workers are blocked so request routing sees every fetch
+        context = self.browser.new_context(
+            viewport=_VIEWPORT,
+            service_workers="block",
+            storage_state=storage_state,
+        )
+        context.set_default_navigation_timeout(self.config.settings.browser.timeout_navigation)
+        context.set_default_timeout(self.config.settings.browser.timeout_element)
+        self.page = context.new_page()
+        if self.config.settings.browser.block_resources:
+            self.page.route("**/*", _block_unneeded_requests)
         
         # Initialize browser-dependent components
         self.business_scraper = BusinessScraper(
@@ -346,14 +395,9 @@ class GoogleMapsScraper:
             cell_logger.warning(f"No listing URLs collected from cell {cell.id}")
             return
 
-        # Persist newly seen place IDs so resumed jobs can skip them
-        existing_ids = set(progress.seen_urls)
-        new_place_ids: List[str] = []
-        for url in listing_urls:
-            place_id = extract_place_id(url)
-            if place_id and place_id not in existing_ids:
-                existing_ids.add(place_id)
-                new_place_ids.append(place_id)
+        # Persist newly seen place IDs so resumed jobs can skip them; the
+        # collected URLs are already filtered against the seen set
+        new_place_ids = [place_id for place_id in map(extract_place_id, listing_urls) if place_id]
 
         if new_place_ids:
             self.progress_tracker.update_progress(seen_urls=new_place_ids)
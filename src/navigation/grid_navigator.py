@@ -4,6 +4,8 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
 from ..utils.logger import get_component_logger
 
 
@@ -75,37 +77,28 @@ class GridNavigator:
         lat_step = (max_lat - min_lat) / self.grid_size
         lng_step = (max_lng - min_lng) / self.grid_size
         
-        grid_cells = []
-        
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                # Calculate cell boundaries
-                cell_min_lat = min_lat + i * lat_step
-                cell_max_lat = min_lat + (i + 1) * lat_step
-                cell_min_lng = min_lng + j * lng_step
-                cell_max_lng = min_lng + (j + 1) * lng_step
-                
-                # Calculate center point
-                center_lat = cell_min_lat + lat_step / 2
-                center_lng = cell_min_lng + lng_step / 2
-                
-                # Create cell ID
-                cell_id = f"{i+1}_{j+1}"
-                
-                cell = GridCell(
-                    id=cell_id,
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    zoom=self.zoom_level,
-                    min_lat=cell_min_lat,
-                    min_lng=cell_min_lng,
-                    max_lat=cell_max_lat,
-                    max_lng=cell_max_lng
-                )
-                
-                grid_cells.append(cell)
+        # Cell edges and centers for every row/column in one vectorized pass
+        steps = np.arange(self.grid_size + 1)
+        lat_edges = (min_lat + steps * lat_step).tolist()
+        lng_edges = (min_lng + steps * lng_step).tolist()
+        lat_centers = (min_lat + (steps[:-1] + 0.5) * lat_step).tolist()
+        lng_centers = (min_lng + (steps[:-1] + 0.5) * lng_step).tolist()
         
-        return grid_cells
+        # Row-major order (latitude outer, longitude inner)
+        return [
+            GridCell(
+                id=f"{i+1}_{j+1}",
+                center_lat=lat_centers[i],
+                center_lng=lng_centers[j],
+                zoom=self.zoom_level,
+                min_lat=lat_edges[i],
+                min_lng=lng_edges[j],
+                max_lat=lat_edges[i + 1],
+                max_lng=lng_edges[j + 1]
+            )
+            for i in range(self.grid_size)
+            for j in range(self.grid_size)
+        ]
     
     def get_cell_by_id(self, cell_id: str) -> Optional[GridCell]:
         """Get a grid cell by its ID.
@@ -15,6 +15,61 @@ from ..utils.helpers import extract_place_id
 from ..utils.logger import get_component_logger
 
 
+# Scrolls the results feed until `target` links are present or no new links
+# arrive for `maxStalls` rounds. Each round waits at most `stallTimeout` ms and
+# moves on as soon as the link count grows.
+_SCROLL_FEED_JS = """async ({feed, link, target, maxStalls, stallTimeout}) => {
+    const count = () => document.querySelectorAll(link).length;
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    let prev = count();
+    let stalls = 0;
+    while (stalls < maxStalls && prev < target) {
+        // Break early if we've found a reasonable amount and aren't making progress
+        if (prev > 40 && stalls >= 2) break;
+        const el = document.querySelector(feed);
+        if (el) {
+            el.scrollTop = el.scrollHeight;
+        } else {
+            window.scrollBy(0, 20000);
+        }
+        for (let waited = 0; waited < stallTimeout && count() <= prev; waited += 100) {
+            await sleep(100);
+        }
+        const n = count();
+        if (n > prev) {
+            stalls = 0;
+            prev = n;
+        } else {
+            stalls++;
+        }
+    }
+    return count();
+}"""
+
+
+# Clicks the results card linking to `url` and returns the business name shown
+# before the click ("" if no panel was open), or null if the card is not on
+# the page. The open panel's name node is flagged so a re-rendered panel can be
+# told apart from it even when both listings share a name.
+_CLICK_RESULT_JS = """({link, name, url}) => {
+    const card = Array.from(document.querySelectorAll(link)).find((a) => a.href === url);
+    if (!card) return null;
+    const current = document.querySelector(name);
+    if (current) current.__gmapsStale = true;
+    card.click();
+    return current ? current.innerText : "";
+}"""
+
+# True once the page URL carries the clicked listing's place ID and the name
+# shown comes from a new panel rather than the one open before the click
+_DETAILS_OPENED_JS = """([selector, placeId, previous]) => {
+    if (!decodeURIComponent(location.href).includes(placeId)) return false;
+    const node = document.querySelector(selector);
+    if (!node || !node.innerText.trim()) return false;
+    return !node.__gmapsStale || node.innerText !== previous;
+}"""
+
+
 class PageNavigator:
     """Handles page navigation and interaction with Google Maps."""
     
@@ -54,7 +109,10 @@ class PageNavigator:
             maps_url = grid_cell.get_maps_url()
             self.logger.info(f"Navigating to grid cell {grid_cell.id}: {maps_url}")
             
-            self.page.goto(maps_url, timeout=self.settings.browser.timeout_navigation)
+            # The search box is all we need, so don't wait for tiles, fonts
+            # and tracking pixels to finish loading
+            self.page.goto(maps_url, wait_until="domcontentloaded",
+                           timeout=self.settings.browser.timeout_navigation)
             self.page.wait_for_timeout(2000)  # Let the page settle
             
             # Save debug screenshot after navigation
@@ -70,6 +128,7 @@ class PageNavigator:
                         self._cookie_banner_handled = True
                         self.save_debug_screenshot("03_after_cookie_handling", grid_cell.id)
                         self.logger.info("Cookie banner handled successfully")
+                        self.save_storage_state()
                     else:
                         self.logger.info("No cookie banner found")
                         
@@ -187,77 +246,21 @@ class PageNavigator:
         Returns:
             Number of listings found after scrolling
         """
-        max_attempts = self.settings.scraping.max_scroll_attempts
-        scroll_interval = self.settings.scraping.scroll_interval
-        static_count_attempts = 0
-        previously_counted = 0
-        
         self.logger.info(f"Starting to scroll for listings (target: {target_count})...")
         
-        while static_count_attempts < max_attempts:
-            current_count = self.page.locator(self.selectors.SEARCH_RESULTS).count()
-            self.logger.debug(f"Currently found: {current_count} listings")
-            
-            # Stop if we have enough listings
-            if current_count >= target_count:
-                self.logger.info(f"Found sufficient results ({current_count})")
-                break
-            
-            # Check if we're making progress
-            if current_count == previously_counted:
-                static_count_attempts += 1
-                self.logger.debug(f"No new results found. Attempt {static_count_attempts}/{max_attempts}")
-            else:
-                static_count_attempts = 0
-                new_listings = current_count - previously_counted
-                self.logger.info(f"Loaded {new_listings} new listings")
-                previously_counted = current_count
-            
-            # Scroll for more results
-            self._scroll_results_feed()
-            self.page.wait_for_timeout(scroll_interval)
-            
-            # Break early if we've found a reasonable amount and aren't making progress
-            if current_count > 40 and static_count_attempts >= 2:
-                self.logger.info("Breaking early - sufficient results found")
-                break
+        # The whole scroll/settle loop runs in the page, so scrolling costs one
+        # round-trip instead of one per scroll
+        final_count = self.page.evaluate(_SCROLL_FEED_JS, {
+            "feed": self.selectors.RESULTS_FEED,
+            "link": self.selectors.SEARCH_RESULTS,
+            "target": target_count,
+            "maxStalls": self.settings.scraping.max_scroll_attempts,
+            "stallTimeout": self.settings.scraping.scroll_interval,
+        })
         
-        final_count = self.page.locator(self.selectors.SEARCH_RESULTS).count()
         self.logger.info(f"Scrolling completed. Final count: {final_count} listings")
         return final_count
     
-    def _scroll_results_feed(self) -> bool:
-        """Scroll the results feed to load more listings.
-        
-        Returns:
-            True if scrolling succeeded
-        """
-        try:
-            # Try JavaScript scrolling first
-            if self.page.locator(self.selectors.RESULTS_FEED).count() > 0:
-                success = self.page.evaluate("""(selector) => {
-                    const element = document.querySelector(selector);
-                    if (element) {
-                        element.scrollTop = element.scrollHeight;
-                        return true;
-                    }
-                    return false;
-                }""", self.selectors.RESULTS_FEED)
-                
-                if success:
-                    return True
-        
-        except Exception as e:
-            self.logger.debug(f"JavaScript scrolling failed: {e}")
-        
-        # Fallback to mouse wheel
-        try:
-            self.page.mouse.wheel(0, 20000)
-            return True
-        except Exception as e:
-            self.logger.debug(f"Mouse wheel scrolling failed: {e}")
-            return False
-    
     def collect_listing_urls(self, seen_urls: Optional[Set[str]] = None) -> List[str]:
         """Collect all listing URLs from the current search results.
         
@@ -274,36 +277,27 @@ class PageNavigator:
             # Wait for listings to be available
             self.page.wait_for_selector(self.selectors.SEARCH_RESULTS, timeout=5000)
             
-            # Get all listing elements
-            all_listings = self.page.locator(self.selectors.SEARCH_RESULTS).all()
-            self.logger.info(f"Found {len(all_listings)} total listing elements")
+            # Read the hrefs of all visible listings in a single round-trip
+            hrefs = self.page.eval_on_selector_all(
+                self.selectors.SEARCH_RESULTS,
+                "els => els.filter(e => e.getClientRects().length > 0).map(e => e.href)",
+            )
+            self.logger.info(f"Found {len(hrefs)} visible listing elements")
             
-            # Extract URLs from visible and accessible listings
-            for idx, listing in enumerate(all_listings):
-                try:
-                    # Check if listing is visible
-                    if not listing.is_visible():
-                        continue
-                    
-                    # Get the href attribute
-                    url = listing.get_attribute('href', timeout=3000)
-                    if not url:
-                        continue
-                    
-                    # Extract place ID for deduplication
-                    place_id = extract_place_id(url)
-                    
-                    # Only add if not already seen
-                    if place_id not in seen_urls:
-                        unique_urls.append(url)
-                        seen_urls.add(place_id)
-                        
-                        if idx < 10 or idx % 10 == 0:  # Log progress for first 10 and every 10th
-                            self.logger.debug(f"Added URL #{len(unique_urls)}: {url[:50]}...")
-                    
-                except Exception as e:
-                    self.logger.debug(f"Error extracting URL from listing {idx}: {e}")
+            for idx, url in enumerate(hrefs):
+                if not url:
                     continue
+                
+                # Extract place ID for deduplication
+                place_id = extract_place_id(url)
+                
+                # Only add if not already seen
+                if place_id not in seen_urls:
+                    unique_urls.append(url)
+                    seen_urls.add(place_id)
+                    
+                    if idx < 10 or idx % 10 == 0:  # Log progress for first 10 and every 10th
+                        self.logger.debug(f"Added URL #{len(unique_urls)}: {url[:50]}...")
             
             self.logger.info(f"Collected {len(unique_urls)} unique URLs")
             return unique_urls
@@ -326,8 +320,14 @@ class PageNavigator:
             NavigationException: If navigation fails
         """
         try:
+            # While the results feed is still open, clicking the card loads the
+            # details panel over XHR instead of reloading Maps
+            if self._open_from_results(url):
+                return True
+            
             self.logger.debug(f"Navigating to business: {url[:50]}...")
-            self.page.goto(url, timeout=timeout)
+            # Only the details panel is read, so skip waiting for the full map load
+            self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
             
             # Wait for business details to load
             return self._wait_for_business_details()
@@ -335,6 +335,46 @@ class PageNavigator:
         except Exception as e:
             raise NavigationException(f"Failed to navigate to business {url}: {e}") from e
     
+    def _open_from_results(self, url: str, timeout: int = 10000) -> bool:
+        """Open a listing by clicking its card in the current results feed.
+        
+        Args:
+            url: Business listing URL
+            timeout: Timeout in milliseconds for the details panel to switch
+            
+        Returns:
+            True if the listing's details panel is showing, False if the card
+            is not on the page or the panel did not switch in time
+        """
+        # The place ID identifies the listing even when neighbouring results
+        # share a name (chain locations); without one only navigation is safe
+        place_id = extract_place_id(url)
+        if not place_id or place_id == url:
+            return False
+        
+        try:
+            previous_name = self.page.evaluate(_CLICK_RESULT_JS, {
+                "link": self.selectors.SEARCH_RESULTS,
+                "name": self.selectors.BUSINESS_NAME,
+                "url": url,
+            })
+            if previous_name is None:
+                return False
+            
+            # The URL switches before the panel does, so also wait for the
+            # previous listing's name to be replaced
+            self.page.wait_for_function(
+                _DETAILS_OPENED_JS,
+                arg=[self.selectors.BUSINESS_NAME, place_id, previous_name],
+                timeout=timeout,
+            )
+            self.logger.debug(f"Opened business from results: {url[:50]}...")
+            return True
+            
+        except Exception as e:
+            self.logger.debug(f"Could not open business from results, falling back to navigation: {e}")
+            return False
+    
     def _wait_for_business_details(self, timeout: int = 10000) -> bool:
         """Wait for business details to load.
         
@@ -346,8 +386,7 @@ class PageNavigator:
         """
         try:
             # Wait for business name to appear
-            self.page.wait_for_selector('//div[@class="TIHn2 "]//h1[@class="DUwDvf lfPIob"]', 
-                                       timeout=timeout)
+            self.page.wait_for_selector(self.selectors.BUSINESS_NAME, timeout=timeout)
             self.logger.debug("Business details loaded successfully")
             return True
             
@@ -423,10 +462,10 @@ class PageNavigator:
             'div[class*="captcha"]'
         ]
         
-        for selector in captcha_selectors:
-            if self.page.locator(selector).count() > 0:
-                self.logger.warning("CAPTCHA detected on page")
-                return True
+        # A selector list checks every marker in one query
+        if self.page.query_selector(', '.join(captcha_selectors)):
+            self.logger.warning("CAPTCHA detected on page")
+            return True
         
         return False
     
@@ -639,6 +678,21 @@ class PageNavigator:
             self.logger.error(f"Error handling cookie banner: {e}")
             return False
     
+    def save_storage_state(self) -> None:
+        """Save the context's cookies and local storage for later runs.
+        
+        Does nothing when no storage state file is configured.
+        """
+        state_file = self.settings.browser.storage_state_file
+        if not state_file:
+            return
+        
+        try:
+            self.page.context.storage_state(path=state_file)
+            self.logger.info(f"Saved browser storage state to {state_file}")
+        except Exception as e:
+            self.logger.warning(f"Could not save browser storage state: {e}")
+    
     def is_on_consent_page(self) -> bool:
         """Check if we're on Google's consent page.
         
@@ -1,7 +1,7 @@
 """CSV writer for business and review data."""
 
+import csv
 import os
-import pandas as pd
 import time
 from pathlib import Path
 from typing import List, Union, Optional
@@ -26,6 +26,10 @@ class CSVWriter:
         self.result_filename = result_filename
         self.reviews_filename = reviews_filename
         self.logger = logging.getLogger(__name__)
+        # Duplicate keys per file, loaded on first append
+        self._seen_keys: dict[str, set] = {}
+        # Open append handles per file, kept for the whole run
+        self._handles: dict[str, tuple] = {}
     
     def write_business(self, business: Business, check_duplicates: bool = True) -> bool:
         """Write a single business record to CSV.
@@ -61,11 +65,32 @@ class CSVWriter:
         Raises:
             PersistenceException: If writing fails
         """
-        written_count = 0
-        for business in businesses:
-            if self.write_business(business, check_duplicates):
-                written_count += 1
-        return written_count
+        if not businesses:
+            return 0
+        
+        try:
+            records = [business.to_dict() for business in businesses]
+            expected_columns = list(records[0].keys())
+            seen = self._load_seen_keys(self.result_filename, expected_columns, ('Names', 'Address'))
+            
+            # Drop repeats within the batch and keys already in the file
+            rows = []
+            for record in records:
+                key = (str(record['Names']), str(record['Address']))
+                if check_duplicates and key in seen:
+                    continue
+                seen.add(key)
+                rows.append(record)
+            
+            self._write_rows(self.result_filename, expected_columns, rows)
+            
+            skipped = len(records) - len(rows)
+            if skipped:
+                self.logger.info(f"Skipped {skipped} duplicate businesses")
+            return len(rows)
+            
+        except Exception as e:
+            raise PersistenceException(f"Failed to batch write businesses: {e}") from e
     
     def write_review(self, review: Review) -> bool:
         """Write a single review to CSV.
@@ -111,16 +136,10 @@ class CSVWriter:
             return 0
         
         try:
-            # Convert reviews to DataFrame for batch writing
             review_dicts = [review.to_dict() for review in valid_reviews]
-            df = pd.DataFrame(review_dicts)
-            
-            # Check if file exists to determine if header is needed
-            file_exists = os.path.isfile(self.reviews_filename)
-            
-            # Write to CSV, append if file exists
-            df.to_csv(self.reviews_filename, mode='a', header=not file_exists, 
-                     index=False, encoding='utf-8-sig')
+            self._write_rows(self.reviews_filename, list(review_dicts[0].keys()),
+                             review_dicts, encoding='utf-8-sig')
+            self._seen_keys.pop(self.reviews_filename, None)
             
             self.logger.info(f"Wrote {len(valid_reviews)} reviews to {self.reviews_filename}")
             return len(valid_reviews)
@@ -145,62 +164,115 @@ class CSVWriter:
         """
         try:
             expected_columns = list(new_data.keys())
+            key_columns = self._key_columns(new_data)
+            seen = self._load_seen_keys(filename, expected_columns, key_columns)
+            key = tuple(str(new_data[column]) for column in key_columns) if key_columns else None
 
-            # Check if file exists
-            if not os.path.exists(filename):
-                df = pd.DataFrame([new_data], columns=expected_columns)
-                df.to_csv(filename, index=False)
-                return True
+            if check_duplicates and key is not None and key in seen:
+                if 'Names' in new_data:
+                    self.logger.info(f"Skipping duplicate: {new_data.get('Names', 'Unknown')}")
+                return False
 
-            existing_df = pd.read_csv(filename)
+            self._write_rows(filename, expected_columns, [new_data])
+            if key is not None:
+                seen.add(key)
+            return True
 
-            # Ensure legacy files are upgraded to the new schema before appending
-            existing_df = self._ensure_business_schema(existing_df, expected_columns, filename)
+        except Exception as e:
+            raise PersistenceException(f"Failed to append to {filename}: {e}") from e
 
-            if check_duplicates and len(existing_df) > 0:
-                if 'Names' in new_data and 'Address' in new_data:
-                    duplicate = existing_df[
-                        (existing_df.get('Names') == new_data['Names']) &
-                        (existing_df.get('Address') == new_data['Address'])
-                    ]
-                    if len(duplicate) > 0:
-                        self.logger.info(f"Skipping duplicate: {new_data.get('Names', 'Unknown')}")
-                        return False
+    def _write_rows(self, filename: str, fieldnames: List[str], rows: List[dict],
+                    encoding: str = 'utf-8') -> None:
+        """Append rows to a CSV file, writing the header for a new file.
+        
+        Uses the csv module directly: building a DataFrame for a handful of
+        rows costs far more than writing them. Output matches what
+        DataFrame.to_csv produced (same encoding and line endings, None
+        written as an empty field). The file is opened on the first append
+        and kept open; every call is still flushed so progress never counts
+        rows that are not on disk.
+        """
+        if not rows:
+            return
+        
+        handle = self._handles.get(filename)
+        if handle is None or handle[1].fieldnames != fieldnames:
+            self._close_file(filename)
+            file_exists = os.path.exists(filename)
+            f = open(filename, 'a', newline='', encoding=encoding)
+            writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+            if not file_exists:
+                writer.writeheader()
+            handle = self._handles[filename] = (f, writer)
+        
+        f, writer = handle
+        writer.writerows(rows)
+        f.flush()
 
-                elif 'place_id' in new_data and 'reviewer_name' in new_data:
-                    duplicate = existing_df[
-                        (existing_df.get('place_id') == new_data['place_id']) &
-                        (existing_df.get('reviewer_name') == new_data['reviewer_name']) &
-                        (existing_df.get('review_text') == new_data['review_text'])
-                    ]
-                    if len(duplicate) > 0:
-                        return False
+    def _close_file(self, filename: str) -> None:
+        """Close the append handle of a file, if one is open."""
+        handle = self._handles.pop(filename, None)
+        if handle is not None:
+            handle[0].close()
 
-            # Append to existing file with aligned header order
-            df = pd.DataFrame([new_data], columns=expected_columns)
-            df.to_csv(filename, mode='a', header=False, index=False)
-            return True
+    def close(self) -> None:
+        """Close all open append handles."""
+        for filename in list(self._handles):
+            self._close_file(filename)
 
-        except Exception as e:
-            raise PersistenceException(f"Failed to append to {filename}: {e}") from e
+    @staticmethod
+    def _key_columns(new_data: dict) -> tuple:
+        """Return the columns that identify a duplicate record of this kind."""
+        if 'Names' in new_data and 'Address' in new_data:
+            return ('Names', 'Address')
+        if 'place_id' in new_data and 'reviewer_name' in new_data:
+            return ('place_id', 'reviewer_name', 'review_text')
+        return ()
 
-    def _ensure_business_schema(self, df: pd.DataFrame, expected_columns: list[str], filename: str) -> pd.DataFrame:
-        """Upgrade legacy CSV files to match the current business schema."""
+    def _load_seen_keys(self, filename: str, expected_columns: list[str],
+                        key_columns: tuple) -> set:
+        """Load the duplicate keys of an existing CSV file once per writer.
+        
+        Later appends are checked against this set instead of re-reading the
+        whole file for every record.
+        """
+        seen = self._seen_keys.get(filename)
+        if seen is not None:
+            return seen
 
-        if df.columns.tolist() == expected_columns:
-            return df
+        seen = set()
+        if os.path.exists(filename):
+            # A single streaming pass over the file; no DataFrame is built
+            with open(filename, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f, restval='')
+                header = reader.fieldnames or []
+                if key_columns and all(column in header for column in key_columns):
+                    seen = {tuple(row[column] for column in key_columns) for row in reader}
+
+            # Ensure legacy files are upgraded to the new schema before appending
+            if header and header != expected_columns and 'Owner Name' in expected_columns:
+                self._upgrade_business_schema(expected_columns, filename)
 
-        if 'Owner Name' not in expected_columns:
-            return df
+        self._seen_keys[filename] = seen
+        return seen
 
-        upgraded_df = df.reindex(columns=expected_columns, fill_value="")
+    def _upgrade_business_schema(self, expected_columns: list[str], filename: str) -> None:
+        """Upgrade a legacy CSV file to match the current business schema."""
+        self._close_file(filename)
         try:
-            upgraded_df.to_csv(filename, index=False)
+            # Stream the rows into the new column order: missing columns are
+            # filled with "" and columns outside the schema are dropped
+            tmp_path = f"{filename}.tmp"
+            with open(filename, newline='', encoding='utf-8-sig') as f, \
+                    open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+                writer = csv.DictWriter(out, fieldnames=expected_columns, restval='',
+                                        extrasaction='ignore', lineterminator=os.linesep)
+                writer.writeheader()
+                writer.writerows(csv.DictReader(f))
+            os.replace(tmp_path, filename)
             self.logger.info("Upgraded business CSV schema to include owner enrichment columns")
         except Exception as exc:
             raise PersistenceException(f"Failed to upgrade business CSV schema: {exc}") from exc
-
-        return upgraded_df
     
     def backup_files(self) -> tuple[Optional[str], Optional[str]]:
         """Create timestamped backups of existing CSV files.
@@ -212,6 +284,10 @@ class CSVWriter:
         business_backup = None
         reviews_backup = None
         
+        # The backed up files are gone, so their duplicate keys no longer apply
+        self._seen_keys.clear()
+        self.close()
+        
         try:
             if os.path.exists(self.result_filename):
                 business_backup = f'result_{timestamp}.csv'
@@ -239,25 +315,61 @@ class CSVWriter:
         """
         if not os.path.exists(self.result_filename):
             return 0
+        
+        # The file may be rewritten below
+        self._close_file(self.result_filename)
             
         try:
-            df = pd.read_csv(self.result_filename)
-            original_count = len(df)
+            # First streaming pass: count duplicates and collect up to two
+            # distinct non-empty values per column of the rows that are kept
+            with open(self.result_filename, newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                name_idx = header.index('Names')
+                address_idx = header.index('Address')
+                col_values = [set() for _ in header]
+                seen = set()
+                duplicates_removed = 0
+                for row in reader:
+                    if not row:
+                        continue
+                    key = (row[name_idx], row[address_idx])
+                    if key in seen:
+                        duplicates_removed += 1
+                        continue
+                    seen.add(key)
+                    for values, value in zip(col_values, row):
+                        if value and len(values) < 2:
+                            values.add(value)
             
-            # Remove duplicates based on name and address
-            df = df.drop_duplicates(subset=['Names', 'Address'])
-            
-            # Remove columns with only one unique value (if any)
-            for column in list(df.columns):
-                if column.startswith('Owner '):
-                    continue
-                if df[column].nunique() <= 1:
-                    df.drop(column, axis=1, inplace=True)
+            # Remove columns with at most one distinct value; owner
+            # enrichment columns are always kept
+            keep = [i for i, column in enumerate(header)
+                    if len(col_values[i]) > 1 or column.startswith('Owner ')]
+            if duplicates_removed == 0 and len(keep) == len(header):
+                return 0
             
-            # Save deduplicated data
-            df.to_csv(self.result_filename, index=False)
+            # Second pass writes the kept rows and columns to a temp file
+            # that replaces the original
+            tmp_path = f"{self.result_filename}.tmp"
+            with open(self.result_filename, newline='', encoding='utf-8-sig') as f, \
+                    open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+                reader = csv.reader(f)
+                next(reader, None)
+                writer = csv.writer(out, lineterminator=os.linesep)
+                writer.writerow([header[i] for i in keep])
+                seen = set()
+                for row in reader:
+                    if not row:
+                        continue
+                    key = (row[name_idx], row[address_idx])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    writer.writerow([row[i] if i < len(row) else '' for i in keep])
+            os.replace(tmp_path, self.result_filename)
+            self._seen_keys.pop(self.result_filename, None)
             
-            duplicates_removed = original_count - len(df)
             if duplicates_removed > 0:
                 self.logger.info(f"Removed {duplicates_removed} duplicates from business data")
             
@@ -272,12 +384,8 @@ class CSVWriter:
         Returns:
             Number of business records in CSV file
         """
-        if not os.path.exists(self.result_filename):
-            return 0
-            
         try:
-            df = pd.read_csv(self.result_filename)
-            return len(df)
+            return self._count_rows(self.result_filename)
         except Exception:
             return 0
     
@@ -287,11 +395,21 @@ class CSVWriter:
         Returns:
             Number of review records in CSV file
         """
-        if not os.path.exists(self.reviews_filename):
-            return 0
-            
         try:
-            df = pd.read_csv(self.reviews_filename)
-            return len(df)
+            return self._count_rows(self.reviews_filename)
         except Exception:
             return 0
+    
+    @staticmethod
+    def _count_rows(filename: str) -> int:
+        """Count the data rows of a CSV file in one streaming pass.
+        
+        Uses csv.reader rather than counting newlines, since review texts
+        can contain line breaks inside quoted fields.
+        """
+        if not os.path.exists(filename):
+            return 0
+        
+        with open(filename, newline='', encoding='utf-8-sig') as f:
+            rows = sum(1 for row in csv.reader(f) if row)
+        return max(0, rows - 1)
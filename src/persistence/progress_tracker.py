@@ -2,7 +2,8 @@
 
 import json
 import os
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, asdict, fields
 from typing import List, Optional, Tuple, Set
 from pathlib import Path
 import logging
@@ -15,7 +16,7 @@ class JobProgress:
     """Data structure for tracking job progress."""
     
     completed_cells: List[str]
-    seen_urls: List[str]  # Store as list for JSON serialization
+    seen_urls: List[str]  # Persisted in the tracker's append-only seen ID log
     results_count: int
     search_term: str
     bounds: List[float]
@@ -38,14 +39,19 @@ class JobProgress:
             self.cell_results = {}
         
         self.last_updated = current_time
+        
+        # Membership index for seen_urls so adds stay O(1); not a dataclass
+        # field, so it is never serialized
+        self._seen_index = set(self.seen_urls)
     
     def get_seen_urls_set(self) -> Set[str]:
         """Get seen URLs as a set for efficient lookup."""
-        return set(self.seen_urls)
+        return set(self._seen_index)
     
     def add_seen_url(self, url: str) -> None:
         """Add a URL to the seen list."""
-        if url not in self.seen_urls:
+        if url not in self._seen_index:
+            self._seen_index.add(url)
             self.seen_urls.append(url)
     
     def add_seen_urls(self, urls: List[str]) -> None:
@@ -105,17 +111,28 @@ class JobProgress:
 
 
 class ProgressTracker:
-    """Manages job progress tracking and persistence."""
+    """Manages job progress tracking and persistence.
+    
+    Seen place IDs grow with every listing, so they are kept out of the
+    progress JSON in a sidecar log with one ID per line. New IDs are
+    appended to it instead of re-serializing the whole list on every save.
+    """
     
-    def __init__(self, filename: str = 'scraper_progress.json'):
+    def __init__(self, filename: str = 'scraper_progress.json', save_interval: float = 5.0):
         """Initialize progress tracker.
         
         Args:
             filename: Name of the progress file
+            save_interval: Minimum seconds between saves triggered by
+                per-listing updates; call flush() to write pending changes
         """
         self.filename = filename
+        self.seen_filename = f"{os.path.splitext(filename)[0]}_seen_ids.txt"
+        self.save_interval = save_interval
         self.logger = logging.getLogger(__name__)
         self._current_progress: Optional[JobProgress] = None
+        self._dirty = False
+        self._last_save = 0.0
     
     def load_progress(self) -> JobProgress:
         """Load progress from file or create new progress.
@@ -131,9 +148,13 @@ class ProgressTracker:
                 with open(self.filename, 'r') as f:
                     data = json.load(f)
                 
+                # Older progress files kept the seen IDs inline
+                seen_urls = list(dict.fromkeys(data.get("seen_urls", []) + self._read_seen_ids()))
+                self._write_seen_ids(seen_urls)
+                
                 progress = JobProgress(
                     completed_cells=data.get("completed_cells", []),
-                    seen_urls=data.get("seen_urls", []),
+                    seen_urls=seen_urls,
                     results_count=data.get("results_count", 0),
                     search_term=data.get("search_term", ""),
                     bounds=data.get("bounds", []),
@@ -183,9 +204,20 @@ class ProgressTracker:
         progress.last_updated = datetime.datetime.now().isoformat()
         
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(asdict(progress), f, indent=2)
+            # Write to a temp file first so a crash mid-write keeps the old progress
+            tmp_path = f"{self.filename}.tmp"
+            # Compact one-shot encoding: json.dumps uses the C encoder while
+            # json.dump(indent=2) streams every list item through Python
+            data = {
+                field.name: getattr(progress, field.name)
+                for field in fields(progress) if field.name != 'seen_urls'
+            }
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps(data, separators=(',', ':')))
+            os.replace(tmp_path, self.filename)
             
+            self._dirty = False
+            self._last_save = time.monotonic()
             self.logger.debug(f"Saved progress to {self.filename}")
             
         except Exception as e:
@@ -229,6 +261,7 @@ class ProgressTracker:
         )
         
         self._current_progress = progress
+        self._write_seen_ids([])
         self.save_progress(progress)
         return progress
     
@@ -250,7 +283,9 @@ class ProgressTracker:
             self._current_progress.results_count = results_count
         
         if seen_urls:
+            known = len(self._current_progress.seen_urls)
             self._current_progress.add_seen_urls(seen_urls)
+            self._append_seen_ids(self._current_progress.seen_urls[known:])
         
         if completed_cells:
             for cell_id in completed_cells:
@@ -263,7 +298,9 @@ class ProgressTracker:
         if self._current_progress is None:
             return
         
+        known = len(self._current_progress.seen_urls)
         self._current_progress.add_seen_url(url)
+        self._append_seen_ids(self._current_progress.seen_urls[known:])
         self.save_progress()
     
     def mark_cell_completed(self, cell_id: str) -> None:
@@ -280,9 +317,39 @@ class ProgressTracker:
             return 0
         
         self._current_progress.results_count += increment
-        self.save_progress()
+        # Called once per listing, so the write is debounced
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.save_interval:
+            self.save_progress()
         return self._current_progress.results_count
     
+    def flush(self) -> None:
+        """Save progress if debounced updates have not been written yet."""
+        if self._dirty and self._current_progress is not None:
+            self.save_progress()
+    
+    def _read_seen_ids(self) -> List[str]:
+        """Read the seen ID log, returning an empty list if there is none."""
+        if not os.path.exists(self.seen_filename):
+            return []
+        with open(self.seen_filename, 'r', encoding='utf-8') as f:
+            return [line.rstrip('\n') for line in f if line.strip()]
+    
+    def _write_seen_ids(self, seen_urls: List[str]) -> None:
+        """Rewrite the seen ID log with exactly the given IDs."""
+        with open(self.seen_filename, 'w', encoding='utf-8') as f:
+            f.writelines(f"{url}\n" for url in seen_urls)
+    
+    def _append_seen_ids(self, seen_urls: List[str]) -> None:
+        """Append newly seen IDs to the log."""
+        if not seen_urls:
+            return
+        try:
+            with open(self.seen_filename, 'a', encoding='utf-8') as f:
+                f.writelines(f"{url}\n" for url in seen_urls)
+        except OSError as e:
+            raise PersistenceException(f"Failed to append to {self.seen_filename}: {e}") from e
+    
     def is_job_complete(self) -> bool:
         """Check if the current job is complete."""
         if self._current_progress is None:
@@ -12,6 +12,25 @@ from ..utils.exceptions import ExtractionException, NavigationException
 from ..utils.logger import get_component_logger
 
 
+# Attribute of the first matched element ("" if unset), or null when nothing matches
+_FIRST_ATTRIBUTE_JS = '(els, attr) => els.length ? (els[0].getAttribute(attr) || "") : null'
+
+# Scrolls the element matched by a CSS or xpath= selector by a pixel amount
+_SCROLL_BY_JS = """
+([selector, amount]) => {
+    const element = selector.startsWith('xpath=')
+        ? document.evaluate(selector.slice(6), document, null,
+                            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(selector);
+    if (element) {
+        element.scrollTop += amount;
+        return true;
+    }
+    return false;
+}
+"""
+
+
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
     
@@ -47,13 +66,30 @@ class BaseScraper(ABC):
             self.logger.debug(f"Element not found: {selector} - {e}")
             return False
     
+    def _wait_attached(self, selector: str, timeout: Optional[int]) -> None:
+        """Wait for an element to be attached when a timeout was given.
+        
+        A miss is left to the following read, which reports it.
+        
+        Args:
+            selector: CSS or XPath selector
+            timeout: Timeout in milliseconds, or None to skip waiting
+        """
+        if not timeout:
+            return
+        try:
+            self.page.wait_for_selector(selector, state="attached", timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"Element did not appear: {selector} - {e}")
+    
     def get_element_text(self, selector: str, timeout: Optional[int] = None, 
                         required: bool = False) -> str:
         """Get text content from an element.
         
         Args:
             selector: CSS or XPath selector
-            timeout: Timeout in milliseconds
+            timeout: Milliseconds to wait for the element to appear; by
+                default only what is already rendered is read
             required: Whether to raise exception if element not found
             
         Returns:
@@ -62,11 +98,12 @@ class BaseScraper(ABC):
         Raises:
             ExtractionException: If required element not found
         """
-        timeout = timeout or self.settings.browser.timeout_short
-        
         try:
-            if self.page.locator(selector).count() > 0:
-                return self.page.locator(selector).inner_text(timeout=timeout).strip()
+            self._wait_attached(selector, timeout)
+            # One call answers both "is it there" and "what does it say"
+            texts = self.page.locator(selector).all_inner_texts()
+            if texts:
+                return texts[0].strip()
             
             if required:
                 raise ExtractionException(f"Required element not found: {selector}")
@@ -86,7 +123,8 @@ class BaseScraper(ABC):
         Args:
             selector: CSS or XPath selector
             attribute: Attribute name
-            timeout: Timeout in milliseconds
+            timeout: Milliseconds to wait for the element to appear; by
+                default only what is already rendered is read
             required: Whether to raise exception if element not found
             
         Returns:
@@ -95,12 +133,11 @@ class BaseScraper(ABC):
         Raises:
             ExtractionException: If required element not found
         """
-        timeout = timeout or self.settings.browser.timeout_short
-        
         try:
-            if self.page.locator(selector).count() > 0:
-                value = self.page.locator(selector).get_attribute(attribute, timeout=timeout)
-                return value or ""
+            self._wait_attached(selector, timeout)
+            value = self.page.locator(selector).evaluate_all(_FIRST_ATTRIBUTE_JS, attribute)
+            if value is not None:
+                return value
             
             if required:
                 raise ExtractionException(f"Required element not found: {selector}")
@@ -120,25 +157,27 @@ class BaseScraper(ABC):
         Args:
             selectors: List of selectors to try
             operation: Operation to perform ('text', 'attribute')
-            timeout: Timeout per selector attempt
+            timeout: Milliseconds to wait for each selector to appear; by
+                default only what is already rendered is read
             **kwargs: Additional arguments for the operation
             
         Returns:
             Result from first successful selector, empty string if all fail
         """
-        timeout = timeout or self.settings.browser.timeout_very_short
-        
         for selector in selectors:
             try:
+                self._wait_attached(selector, timeout)
+                # Each attempt is a single round-trip that also covers the miss case
                 if operation == "text":
-                    if self.page.locator(selector).count() > 0:
-                        return self.page.locator(selector).inner_text(timeout=timeout).strip()
+                    texts = self.page.locator(selector).all_inner_texts()
+                    if texts:
+                        return texts[0].strip()
                         
                 elif operation == "attribute":
                     attribute = kwargs.get("attribute", "")
-                    if self.page.locator(selector).count() > 0:
-                        value = self.page.locator(selector).get_attribute(attribute, timeout=timeout)
-                        return value or ""
+                    value = self.page.locator(selector).evaluate_all(_FIRST_ATTRIBUTE_JS, attribute)
+                    if value is not None:
+                        return value
                         
             except Exception as e:
                 self.logger.debug(f"Selector {selector} failed: {e}")
@@ -164,8 +203,9 @@ class BaseScraper(ABC):
         timeout = timeout or self.settings.browser.timeout_short
         
         try:
-            if self.page.locator(selector).count() > 0:
-                self.page.locator(selector).click(timeout=timeout)
+            element = self.page.query_selector(selector)
+            if element:
+                element.click(timeout=timeout)
                 return True
             
             if required:
@@ -190,50 +230,22 @@ class BaseScraper(ABC):
             True if scroll succeeded, False otherwise
         """
         try:
-            if selector.startswith('xpath='):
-                # For XPath selectors
-                success = self.page.evaluate("""
-                    (xpath, amount) => {
-                        const result = document.evaluate(xpath, document, null, 
-                                                        XPathResult.FIRST_ORDERED_NODE_TYPE, null);
-                        const element = result.singleNodeValue;
-                        if (element) {
-                            element.scrollTop += amount;
-                            return true;
-                        }
-                        return false;
-                    }
-                """, selector.replace('xpath=', ''), scroll_amount)
-                
-                if success:
-                    self.logger.debug(f"Scrolled {selector} by {scroll_amount}px")
-                    return True
-                    
-            else:
-                # For CSS selectors
-                success = self.page.evaluate("""
-                    (selector, amount) => {
-                        const element = document.querySelector(selector);
-                        if (element) {
-                            element.scrollTop += amount;
-                            return true;
-                        }
-                        return false;
-                    }
-                """, selector, scroll_amount)
+            # The selector and amount travel as one argument, so the script
+            # source is the same on every call
+            success = self.page.evaluate(_SCROLL_BY_JS, [selector, scroll_amount])
+            if success:
+                self.logger.debug(f"Scrolled {selector} by {scroll_amount}px")
+                return True
                 
-                if success:
-                    self.logger.debug(f"Scrolled {selector} by {scroll_amount}px")
-                    return True
-                    
         except Exception as e:
             self.logger.debug(f"JavaScript scroll failed for {selector}: {e}")
         
         # Fallback to mouse wheel
         try:
-            if self.page.locator(selector).count() > 0:
+            element = self.page.query_selector(selector)
+            if element:
                 # Scroll into view first
-                self.page.locator(selector).first.scroll_into_view_if_needed()
+                element.scroll_into_view_if_needed()
                 # Then use mouse wheel
                 self.page.mouse.wheel(0, scroll_amount)
                 self.logger.debug(f"Used mouse wheel fallback for {selector}")
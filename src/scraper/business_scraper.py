@@ -1,6 +1,6 @@
 """Business information scraper for Google Maps."""
 
-from typing import Optional, List
+from typing import List
 import re
 
 from playwright.sync_api import Page
@@ -15,6 +15,63 @@ from ..utils.exceptions import ExtractionException
 from .base_scraper import BaseScraper
 
 
+# Resolves every detail field in one page.evaluate call. Each text/attr field
+# maps to a list of fallback selectors (XPath or CSS); the first non-empty match
+# wins. List fields take a CSS selector and return the text of every match.
+_BATCH_FIELDS_JS = """
+(fields) => {
+    const find = (sel) => {
+        if (sel.startsWith('xpath=')) sel = sel.slice(6);
+        if (sel.startsWith('/') || sel.startsWith('(')) {
+            return document.evaluate(sel, document, null,
+                                     XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        try {
+            return document.querySelector(sel);
+        } catch (e) {
+            return null;
+        }
+    };
+    const out = {};
+    for (const [key, selectors] of Object.entries(fields.text)) {
+        out[key] = "";
+        for (const sel of selectors) {
+            const node = find(sel);
+            if (node && node.innerText.trim()) {
+                out[key] = node.innerText;
+                break;
+            }
+        }
+    }
+    for (const [key, [selectors, attr]] of Object.entries(fields.attr)) {
+        out[key] = "";
+        for (const sel of selectors) {
+            const node = find(sel);
+            const value = node ? node.getAttribute(attr) : null;
+            if (value) {
+                out[key] = value;
+                break;
+            }
+        }
+    }
+    for (const [key, sel] of Object.entries(fields.list)) {
+        out[key] = Array.from(document.querySelectorAll(sel), (node) => node.innerText);
+    }
+    return out;
+}
+"""
+
+# Strips the narrow no-break spaces Maps puts inside opening hours
+_NARROW_NBSP_TABLE = str.maketrans('', '', '\u202f')
+_NEWLINE_TABLE = str.maketrans('', '', '\n')
+
+# Text between the first and second '·' of a service info line
+_INFO_RE = re.compile(r'·([^·]*)')
+
+# Keyword in a service info line -> index of the flag it sets
+_SERVICE_KEYWORDS = {'shop': 0, 'pickup': 1, 'delivery': 2}
+
+
 class BusinessScraper(BaseScraper):
     """Scraper for extracting business information from Google Maps."""
     
@@ -27,6 +84,25 @@ class BusinessScraper(BaseScraper):
             selectors: Selector configuration
         """
         super().__init__(page, settings, selectors)
+        self._batch_fields = {
+            "text": {
+                "name": [selectors.BUSINESS_NAME],
+                "address": [selectors.BUSINESS_ADDRESS],
+                "website": [selectors.BUSINESS_WEBSITE],
+                "phone": [selectors.BUSINESS_PHONE],
+                "place_type": [selectors.BUSINESS_TYPE],
+                "intro": selectors.BUSINESS_INTRO_SELECTORS,
+                "reviews_count": [selectors.REVIEWS_COUNT],
+                "reviews_average": selectors.REVIEWS_AVERAGE,
+                "opens_at": [selectors.OPENS_AT, selectors.OPENS_AT_ALT],
+            },
+            "attr": {
+                "rating": [[selectors.RATING_SELECTOR], "aria-label"],
+            },
+            "list": {
+                "service_info": selectors.SERVICE_INFO,
+            },
+        }
     
     def extract_data(self, maps_url: str) -> Business:
         """Extract business data from the current page.
@@ -44,25 +120,30 @@ class BusinessScraper(BaseScraper):
             # Extract place ID from URL
             place_id = extract_place_id(maps_url)
             
-            # Wait for main business info to load
-            self.wait_for_element(self.selectors.BUSINESS_NAME, timeout=10000)
+            # navigate_to_business already waited for the business name, so read
+            # every field straight away in a single round-trip and parse in Python
+            fields = self._read_fields()
             
             # Extract basic business information
-            business_name = self.get_element_text(self.selectors.BUSINESS_NAME, required=True)
-            address = self.get_element_text(self.selectors.BUSINESS_ADDRESS)
-            website = self._extract_website()
-            phone = self._extract_phone()
-            business_type = self.get_element_text(self.selectors.BUSINESS_TYPE)
-            introduction = self._extract_introduction()
+            business_name = fields["name"].strip()
+            if not business_name:
+                raise ExtractionException(f"Required element not found: {self.selectors.BUSINESS_NAME}")
+            address = fields["address"].strip()
+            website = clean_website_url(fields["website"]) if fields["website"] else None
+            phone = clean_phone_number(fields["phone"]) if fields["phone"] else None
+            business_type = fields["place_type"].strip()
+            introduction = clean_text(fields["intro"]) if fields["intro"] else "None Found"
             
             # Extract review information
-            review_count, review_average = self._extract_review_info()
+            review_count, review_average = self._parse_review_info(fields)
             
             # Extract operating hours
-            opens_at = self._extract_opening_hours()
+            opens_at = self._parse_opening_hours(fields["opens_at"])
             
             # Extract service information
-            store_shopping, in_store_pickup, store_delivery = self._extract_service_info()
+            store_shopping, in_store_pickup, store_delivery = self._parse_service_info(
+                fields["service_info"]
+            )
             
             # Create and return business instance
             business = Business(
@@ -94,74 +175,50 @@ class BusinessScraper(BaseScraper):
                 maps_url=maps_url
             )
     
-    def _extract_website(self) -> Optional[str]:
-        """Extract website URL."""
-        website = self.get_element_text(self.selectors.BUSINESS_WEBSITE)
-        return clean_website_url(website) if website else None
-    
-    def _extract_phone(self) -> Optional[str]:
-        """Extract phone number."""
-        phone = self.get_element_text(self.selectors.BUSINESS_PHONE)
-        return clean_phone_number(phone) if phone else None
-    
-    def _extract_introduction(self) -> str:
-        """Extract business introduction/description."""
-        # Try multiple selectors for introduction
-        intro_selectors = [
-            self.selectors.BUSINESS_INTRO,
-            '//*[@id="QA0Szd"]/div/div/div[1]/div[2]/div/div[1]/div/div/div[8]/button/div[3]/div/div[1]',
-            '//div[@class="WeS02d fontBodyMedium"]//div[@class="PYvSYb"]',
-            '//button//div[@class="WeS02d fontBodyMedium"]//div[@class="PYvSYb"]'
-        ]
+    def _read_fields(self) -> dict:
+        """Read all detail fields from the page with one evaluate call.
         
-        introduction = self.try_multiple_selectors(intro_selectors, "text")
-        return clean_text(introduction) if introduction else "None Found"
+        Returns:
+            Dict of raw field text keyed by field name
+        """
+        return self.page.evaluate(_BATCH_FIELDS_JS, self._batch_fields)
     
-    def _extract_review_info(self) -> tuple[int, float]:
-        """Extract review count and average rating.
+    def _parse_review_info(self, fields: dict) -> tuple[int, float]:
+        """Parse review count and average rating.
         
+        Args:
+            fields: Raw field text from _read_fields
+            
         Returns:
             Tuple of (review_count, review_average)
         """
         review_count = 0
         review_average = 0.0
         
-        # Extract review count
-        review_count_text = self.get_element_text(self.selectors.REVIEWS_COUNT)
-        if review_count_text:
-            review_count = parse_review_count(review_count_text)
+        if fields["reviews_count"]:
+            review_count = parse_review_count(fields["reviews_count"])
             
             # If we have reviews, try to get the average rating
             if review_count > 0:
-                # Try multiple selectors for rating
-                rating_text = self.get_element_attribute(
-                    self.selectors.RATING_SELECTOR, 
-                    "aria-label"
-                )
-                
+                rating_text = fields["rating"]
                 if rating_text:
                     review_average = parse_rating_value(rating_text)
                     self.logger.debug(f"Found rating: {rating_text} -> {review_average}")
-                else:
-                    # Try alternative selectors
-                    for selector in self.selectors.REVIEWS_AVERAGE:
-                        rating_text = self.get_element_text(selector)
-                        if rating_text:
-                            review_average = parse_rating_value(rating_text)
-                            if review_average > 0:
-                                break
+                elif fields["reviews_average"]:
+                    # Fall back to the visible average text
+                    review_average = parse_rating_value(fields["reviews_average"])
         
         return review_count, review_average
     
-    def _extract_opening_hours(self) -> str:
-        """Extract opening hours information."""
-        # Try primary selector
-        opens_text = self.get_element_text(self.selectors.OPENS_AT)
-        
-        if not opens_text:
-            # Try alternative selector
-            opens_text = self.get_element_text(self.selectors.OPENS_AT_ALT)
+    def _parse_opening_hours(self, opens_text: str) -> str:
+        """Parse opening hours information.
         
+        Args:
+            opens_text: Raw opening hours text
+            
+        Returns:
+            Cleaned opening hours text
+        """
         if opens_text:
             # Clean up the text
             opens = opens_text.split('⋅')
@@ -169,38 +226,35 @@ class BusinessScraper(BaseScraper):
                 opens_text = opens[1]
             
             # Remove special unicode spaces
-            opens_text = opens_text.replace("\u202f", "").strip()
+            opens_text = opens_text.translate(_NARROW_NBSP_TABLE).strip()
             
             return clean_text(opens_text)
         
         return ""
     
-    def _extract_service_info(self) -> tuple[str, str, str]:
-        """Extract service type information (shopping, pickup, delivery).
+    def _parse_service_info(self, info_texts: List[str]) -> tuple[str, str, str]:
+        """Parse service type information (shopping, pickup, delivery).
         
+        Args:
+            info_texts: Raw text of the info sections
+            
         Returns:
             Tuple of (store_shopping, in_store_pickup, store_delivery)
         """
-        store_shopping = "No"
-        in_store_pickup = "No" 
-        store_delivery = "No"
+        flags = ["No", "No", "No"]
         
         # Check each info section
-        for info_selector in [self.selectors.INFO1, self.selectors.INFO2, self.selectors.INFO3]:
-            info_text = self.get_element_text(info_selector)
-            if info_text and '·' in info_text:
-                # Split on bullet point and get second part
-                parts = info_text.split('·')
-                if len(parts) > 1:
-                    service_text = parts[1].replace("\n", "").lower()
-                    
-                    if 'shop' in service_text:
-                        store_shopping = "Yes"
-                    elif 'pickup' in service_text:
-                        in_store_pickup = "Yes"  
-                    elif 'delivery' in service_text:
-                        store_delivery = "Yes"
+        for info_text in info_texts:
+            # Classify the part after the bullet point
+            match = _INFO_RE.search(info_text)
+            if match:
+                service_text = match.group(1).translate(_NEWLINE_TABLE).lower()
+                for keyword, slot in _SERVICE_KEYWORDS.items():
+                    if keyword in service_text:
+                        flags[slot] = "Yes"
+                        break
         
+        store_shopping, in_store_pickup, store_delivery = flags
         return store_shopping, in_store_pickup, store_delivery
     
     def wait_for_business_details(self, timeout: int = 10000) -> bool:
@@ -220,11 +274,13 @@ class BusinessScraper(BaseScraper):
         Returns:
             List of info section texts
         """
-        info_sections = []
-        
-        for i, selector in enumerate([self.selectors.INFO1, self.selectors.INFO2, self.selectors.INFO3], 1):
-            text = self.get_element_text(selector)
-            if text:
-                info_sections.append(f"Info{i}: {text}")
+        # One round-trip for every section instead of probing them one by one
+        try:
+            texts = self.page.eval_on_selector_all(
+                self.selectors.SERVICE_INFO, "els => els.map((el) => el.innerText)"
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not read info sections: {e}")
+            return []
         
-        return info_sections
\ No newline at end of file
+        return [f"Info{i}: {text}" for i, text in enumerate(texts, 1) if text]
\ No newline at end of file
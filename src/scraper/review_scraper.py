@@ -1,7 +1,7 @@
 """Review scraper for Google Maps businesses."""
 
 from typing import List, Optional
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 
 from ..models.review import Review  
 from ..config.selectors import Selectors
@@ -11,6 +11,45 @@ from ..utils.exceptions import ExtractionException
 from .base_scraper import BaseScraper
 
 
+# Reads the fields of up to `limit` review containers in one call. Each field
+# takes the first of its fallback selectors that matches inside the container.
+_REVIEW_FIELDS_JS = """(els, [fields, limit]) => els.slice(0, limit).map((el) => {
+    const find = (sel) => {
+        try {
+            return el.querySelector(sel.replace(/^css=/, ''));
+        } catch (e) {
+            return null;
+        }
+    };
+    const out = {};
+    for (const [key, selectors] of Object.entries(fields.text)) {
+        out[key] = "";
+        for (const sel of selectors) {
+            const node = find(sel);
+            if (node) {
+                out[key] = node.innerText;
+                break;
+            }
+        }
+    }
+    for (const [key, [selectors, attr]] of Object.entries(fields.attr)) {
+        out[key] = null;
+        for (const sel of selectors) {
+            const node = find(sel);
+            const value = node ? node.getAttribute(attr) : null;
+            if (value !== null) {
+                out[key] = value;
+                break;
+            }
+        }
+    }
+    return out;
+})"""
+
+# True once more elements match a selector than before the last scroll
+_MORE_MATCHES_JS = "([sel, prev]) => document.querySelectorAll(sel).length > prev"
+
+
 class ReviewScraper(BaseScraper):
     """Scraper for extracting reviews from Google Maps businesses."""
     
@@ -23,6 +62,17 @@ class ReviewScraper(BaseScraper):
             selectors: Selector configuration
         """
         super().__init__(page, settings, selectors)
+        self._review_fields = {
+            "text": {
+                "reviewer_name": selectors.REVIEWER_NAME_SELECTORS,
+                "review_text": selectors.REVIEW_TEXT_SELECTORS,
+                "review_date": selectors.REVIEW_DATE_SELECTORS,
+                "owner_response": selectors.OWNER_RESPONSE_SELECTORS,
+            },
+            "attr": {
+                "stars": [selectors.REVIEW_STARS_SELECTORS, "aria-label"],
+            },
+        }
     
     def extract_data(self, business_name: str, business_address: str, place_id: str,
                     total_reviews_count: Optional[int] = None, 
@@ -43,11 +93,17 @@ class ReviewScraper(BaseScraper):
         
         try:
             # Click on reviews tab if available
-            if not self._navigate_to_reviews_tab():
+            tab_opened = self._navigate_to_reviews_tab()
+            if not tab_opened:
                 self.logger.info("Could not access reviews tab, checking for existing reviews")
             
-            # Wait for review containers to appear
-            if not self.wait_for_element(self.selectors.REVIEW_CONTAINERS, timeout=5000):
+            # Wait for review containers to appear. Without the tab nothing
+            # more is going to load, so only look for ones already rendered
+            if tab_opened:
+                found = self.wait_for_element(self.selectors.REVIEW_CONTAINERS, timeout=5000)
+            else:
+                found = self.page.query_selector(self.selectors.REVIEW_CONTAINERS) is not None
+            if not found:
                 self.logger.info("No reviews found for this location")
                 return reviews
             
@@ -84,7 +140,6 @@ class ReviewScraper(BaseScraper):
         for selector in self.selectors.REVIEWS_TAB_SELECTORS:
             if self.safe_click(selector):
                 self.logger.info(f"Clicked reviews tab with selector: {selector}")
-                self.safe_wait(2000)  # Wait for reviews to load
                 return True
                 
         self.logger.info("Could not find or click reviews tab")
@@ -117,7 +172,7 @@ class ReviewScraper(BaseScraper):
         return target
     
     def _load_reviews_with_scrolling(self, target_reviews: int, 
-                                   total_reviews_count: Optional[int]) -> List:
+                                   total_reviews_count: Optional[int]) -> Locator:
         """Load reviews by scrolling if necessary.
         
         Args:
@@ -125,11 +180,11 @@ class ReviewScraper(BaseScraper):
             total_reviews_count: Total reviews available
             
         Returns:
-            List of review container elements
+            Locator matching every loaded review container
         """
-        # Get initial review containers
-        review_containers = self.page.locator(self.selectors.REVIEW_CONTAINERS).all()
-        initial_count = len(review_containers)
+        # One locator serves the initial count, every scroll tick and the final read
+        containers = self.page.locator(self.selectors.REVIEW_CONTAINERS)
+        initial_count = containers.count()
         
         self.logger.info(f"Found {initial_count} initial reviews")
         
@@ -137,11 +192,11 @@ class ReviewScraper(BaseScraper):
         if initial_count < target_reviews and self._should_scroll_for_more_reviews(
             initial_count, target_reviews, total_reviews_count
         ):
-            review_containers = self._scroll_for_more_reviews(
-                target_reviews, total_reviews_count, initial_count
+            self._scroll_for_more_reviews(
+                containers, target_reviews, total_reviews_count, initial_count
             )
         
-        return review_containers
+        return containers
     
     def _should_scroll_for_more_reviews(self, current_count: int, target_count: int,
                                       total_available: Optional[int]) -> bool:
@@ -163,18 +218,16 @@ class ReviewScraper(BaseScraper):
             
         return True
     
-    def _scroll_for_more_reviews(self, target_reviews: int, 
+    def _scroll_for_more_reviews(self, containers: Locator, target_reviews: int,
                                total_reviews_count: Optional[int],
-                               initial_count: int) -> List:
+                               initial_count: int) -> None:
         """Scroll the reviews container to load more reviews.
         
         Args:
+            containers: Locator matching every review container
             target_reviews: Target number of reviews
             total_reviews_count: Total reviews available  
             initial_count: Initial number of loaded reviews
-            
-        Returns:
-            List of review container elements after scrolling
         """
         scroll_attempts = 0
         previous_count = initial_count
@@ -193,20 +246,21 @@ class ReviewScraper(BaseScraper):
             # Fallback: scroll with mouse wheel if JavaScript failed
             if not scroll_success:
                 try:
-                    if self.page.locator(self.selectors.REVIEW_CONTAINERS).count() > 0:
-                        self.page.locator(self.selectors.REVIEW_CONTAINERS).first.scroll_into_view_if_needed()
+                    # One query finds the first review and returns its handle
+                    first_review = self.page.query_selector(self.selectors.REVIEW_CONTAINERS)
+                    if first_review:
+                        first_review.scroll_into_view_if_needed()
                         self.page.mouse.wheel(0, 2000)
                         scroll_success = True
                         self.logger.debug("Used mouse wheel fallback for scrolling")
                 except Exception as e:
                     self.logger.warning(f"Mouse wheel scrolling failed: {e}")
             
-            # Wait for new content to load
-            self.safe_wait(scroll_interval)
+            # Wait for new content to load, returning as soon as it arrives
+            self._wait_for_more_reviews(previous_count, scroll_interval)
             
             # Check if we got more reviews
-            current_containers = self.page.locator(self.selectors.REVIEW_CONTAINERS).all()
-            current_count = len(current_containers)
+            current_count = containers.count()
             
             self.logger.debug(f"After scroll: {current_count}/{target_reviews} reviews")
             
@@ -236,16 +290,34 @@ class ReviewScraper(BaseScraper):
                 self.logger.info(f"Loaded {new_reviews_loaded} new reviews")
             
             previous_count = current_count
+    
+    def _wait_for_more_reviews(self, previous_count: int, timeout: int) -> bool:
+        """Wait until more review containers than previous_count are loaded.
         
-        return self.page.locator(self.selectors.REVIEW_CONTAINERS).all()
+        Args:
+            previous_count: Number of containers before the last scroll
+            timeout: Maximum time to wait in milliseconds
+            
+        Returns:
+            True if new reviews appeared before the timeout
+        """
+        try:
+            self.page.wait_for_function(
+                _MORE_MATCHES_JS,
+                arg=[self.selectors.REVIEW_CONTAINERS, previous_count],
+                timeout=timeout,
+            )
+            return True
+        except Exception:
+            return False
     
-    def _process_review_containers(self, containers: List, business_name: str,
+    def _process_review_containers(self, containers: Locator, business_name: str,
                                  business_address: str, place_id: str,
                                  target_reviews: int) -> List[Review]:
         """Process review containers and extract review data.
         
         Args:
-            containers: List of review container elements
+            containers: Locator matching every review container
             business_name: Name of the business
             business_address: Address of the business
             place_id: Place ID of the business
@@ -257,16 +329,19 @@ class ReviewScraper(BaseScraper):
         reviews = []
         batch_size = self.settings.scraping.review_batch_size
         
-        # Process reviews in batches
-        review_count_to_process = min(len(containers), target_reviews)
+        # Read every field of every review in one evaluate; the fallback
+        # selectors are tried in the page instead of one round-trip each
+        review_fields = containers.evaluate_all(
+            _REVIEW_FIELDS_JS, [self._review_fields, target_reviews]
+        )
+        review_count_to_process = len(review_fields)
         
         for i in range(0, review_count_to_process, batch_size):
-            end_idx = min(i + batch_size, review_count_to_process)
             batch_reviews = []
             
-            for j in range(i, end_idx):
+            for fields in review_fields[i:i + batch_size]:
                 review = self._extract_single_review(
-                    containers[j], business_name, business_address, place_id
+                    fields, business_name, business_address, place_id
                 )
                 
                 if review and review.is_valid():
@@ -280,12 +355,12 @@ class ReviewScraper(BaseScraper):
         
         return reviews
     
-    def _extract_single_review(self, container, business_name: str,
+    def _extract_single_review(self, fields: dict, business_name: str,
                              business_address: str, place_id: str) -> Optional[Review]:
-        """Extract data from a single review container.
+        """Build a review from the raw fields of a single review container.
         
         Args:
-            container: Review container element
+            fields: Raw field text read by _REVIEW_FIELDS_JS
             business_name: Name of the business
             business_address: Address of the business  
             place_id: Place ID of the business
@@ -294,43 +369,20 @@ class ReviewScraper(BaseScraper):
             Review instance or None if extraction failed
         """
         try:
-            # Extract reviewer name
-            reviewer_name = self._extract_with_fallback_selectors(
-                container, self.selectors.REVIEWER_NAME_SELECTORS
-            )
-            
-            # Extract review text
-            review_text = self._extract_with_fallback_selectors(
-                container, self.selectors.REVIEW_TEXT_SELECTORS
-            )
-            
-            # Extract star rating
-            stars = self._extract_review_rating(container)
-            
-            # Extract review date
-            review_date = self._extract_with_fallback_selectors(
-                container, self.selectors.REVIEW_DATE_SELECTORS
-            )
-            
-            # Extract owner response
-            owner_response = self._extract_with_fallback_selectors(
-                container, self.selectors.OWNER_RESPONSE_SELECTORS
-            )
-            
-            # Detect language
-            language = detect_language(review_text)
+            review_text = fields["review_text"]
+            stars_text = fields["stars"]
             
             # Create review object
             review = Review(
                 place_id=place_id,
                 business_name=business_name,
                 business_address=business_address,
-                reviewer_name=clean_text(reviewer_name),
+                reviewer_name=clean_text(fields["reviewer_name"]),
                 review_text=clean_text(review_text),
-                rating=stars,
-                review_date=clean_text(review_date),
-                owner_response=clean_text(owner_response),
-                language=language
+                rating=parse_star_rating(stars_text) if stars_text is not None else 0,
+                review_date=clean_text(fields["review_date"]),
+                owner_response=clean_text(fields["owner_response"]),
+                language=detect_language(review_text)
             )
             
             return review
@@ -338,39 +390,3 @@ class ReviewScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error extracting single review: {e}")
             return None
-    
-    def _extract_with_fallback_selectors(self, container, selectors: List[str]) -> str:
-        """Extract text using multiple fallback selectors.
-        
-        Args:
-            container: Container element to search within
-            selectors: List of selectors to try
-            
-        Returns:
-            Extracted text or empty string
-        """
-        for selector in selectors:
-            try:
-                if container.locator(selector).count() > 0:
-                    return container.locator(selector).inner_text()
-            except Exception:
-                continue
-        return ""
-    
-    def _extract_review_rating(self, container) -> int:
-        """Extract star rating from review container.
-        
-        Args:
-            container: Review container element
-            
-        Returns:
-            Star rating (0-5)
-        """
-        for selector in self.selectors.REVIEW_STARS_SELECTORS:
-            try:
-                if container.locator(selector).count() > 0:
-                    stars_text = container.locator(selector).get_attribute('aria-label')
-                    return parse_star_rating(stars_text)
-            except Exception:
-                continue
-        return 0
\ No newline at end of file
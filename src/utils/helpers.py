@@ -5,6 +5,17 @@ from typing import Optional
 import logging
 
 
+_PAREN_COMMA_TABLE = str.maketrans('', '', '(),')
+_DECIMAL_COMMA_TABLE = str.maketrans(',', '.')
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+_RATING_RE = re.compile(r'(\d+[.,]\d+|\d+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PLACE_ID_RE = re.compile(r'!19s([^!]*)')
+_PLACE_SEGMENT_RE = re.compile(r'(?:^|/)([^/]*:0x[^/]*)')
+_WORD_RE = re.compile(r'\w+')
+_GERMAN_WORDS = frozenset({'und', 'der', 'die', 'das', 'ist', 'sehr', 'gut', 'für', 'mit', 'von', 'nicht'})
+_ENGLISH_WORDS = frozenset({'and', 'the', 'is', 'very', 'good', 'for', 'with', 'not', 'this', 'that'})
+
 def extract_place_id(url: str) -> str:
     """Extract the unique place ID from a Google Maps URL.
     
@@ -14,25 +25,22 @@ def extract_place_id(url: str) -> str:
     Returns:
         Place ID string, or the full URL if extraction fails
     """
-    try:
-        # Look for the !19s pattern which is followed by the place ID
-        if '!19s' in url:
-            # Extract everything after !19s
-            place_id = url.split('!19s')[1].split('!')[0]
-            return place_id
-        
-        # Alternative method - look for the data= pattern
-        elif 'data=' in url:
-            parts = url.split('/')
-            # Find the part with business ID
-            for part in parts:
-                if ':0x' in part:
-                    return part
-        
-        # If neither method works, use the full URL (less efficient)
-        return url
-    except Exception:
+    if not url:
         return url
+    
+    # Look for the !19s pattern which is followed by the place ID
+    match = _PLACE_ID_RE.search(url)
+    if match:
+        return match.group(1)
+    
+    # Alternative method - the path segment holding the 0x business ID
+    if 'data=' in url:
+        match = _PLACE_SEGMENT_RE.search(url)
+        if match:
+            return match.group(1)
+    
+    # If neither method works, use the full URL (less efficient)
+    return url
 
 
 def parse_star_rating(star_text: Optional[str]) -> int:
@@ -47,13 +55,19 @@ def parse_star_rating(star_text: Optional[str]) -> int:
     if not star_text:
         return 0
     
-    # Extract the number from text like "5 Sterne" or "1 Stern"
-    match = re.search(r'(\d+)', star_text)
-    if match:
-        rating = int(match.group(1))
-        # Ensure rating is in valid range
-        return max(0, min(5, rating))
-    return 0
+    # Read the first run of digits in text like "5 Sterne" or "1 Stern"; a
+    # plain scan beats a regex search on these short labels
+    rating = 0
+    in_number = False
+    for ch in star_text:
+        if ch.isdecimal():
+            rating = rating * 10 + int(ch)
+            in_number = True
+        elif in_number:
+            break
+    
+    # Ensure rating is in valid range
+    return max(0, min(5, rating))
 
 
 def detect_language(text: str) -> str:
@@ -68,15 +82,10 @@ def detect_language(text: str) -> str:
     if not text:
         return "unknown"
         
-    # Simple language detection based on common words
-    german_words = ['und', 'der', 'die', 'das', 'ist', 'sehr', 'gut', 'für', 'mit', 'von', 'nicht']
-    english_words = ['and', 'the', 'is', 'very', 'good', 'for', 'with', 'not', 'this', 'that']
-    
-    text_lower = text.lower()
-    words = re.findall(r'\b\w+\b', text_lower)
-    
-    german_count = sum(1 for word in words if word in german_words)
-    english_count = sum(1 for word in words if word in english_words)
+    # Count common words of each language with set lookups
+    words = _WORD_RE.findall(text.lower())
+    german_count = sum(word in _GERMAN_WORDS for word in words)
+    english_count = sum(word in _ENGLISH_WORDS for word in words)
     
     if german_count > english_count:
         return "de"
@@ -135,10 +144,10 @@ def parse_review_count(review_text: str) -> int:
         return 0
     
     # Remove parentheses and commas
-    clean_text = review_text.replace('(', '').replace(')', '').replace(',', '').strip()
+    clean_text = review_text.translate(_PAREN_COMMA_TABLE).strip()
     
     # Extract first number found
-    match = re.search(r'(\d+)', clean_text)
+    match = _FIRST_NUMBER_RE.search(clean_text)
     if match:
         try:
             return int(match.group(1))
@@ -161,10 +170,10 @@ def parse_rating_value(rating_text: str) -> float:
         return 0.0
     
     # Look for decimal number with comma or dot
-    matches = re.search(r'(\d+[.,]\d+|\d+)', rating_text)
+    matches = _RATING_RE.search(rating_text)
     if matches:
         try:
-            rating_str = matches.group(1).replace(',', '.')
+            rating_str = matches.group(1).translate(_DECIMAL_COMMA_TABLE)
             rating = float(rating_str)
             # Ensure rating is in valid range
             return max(0.0, min(5.0, rating))
@@ -187,7 +196,7 @@ def clean_text(text: str) -> str:
         return ""
     
     # Replace multiple whitespace with single space and strip
-    cleaned = re.sub(r'\s+', ' ', text.strip())
+    cleaned = _WHITESPACE_RE.sub(' ', text.strip())
     return cleaned
 
 